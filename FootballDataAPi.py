@@ -1,80 +1,987 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd # Toujours présent, mais non utilisé. À enlever si non nécessaire.
 import json
 import os
+import re
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import tkinter as tk
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
+from PIL import Image, ImageDraw, ImageTk
 from io import BytesIO
 import threading
+import heapq
+import itertools
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
+from FootballDataCache import ImageDirectoryCache, create_cache_backend
+
+try:
+    import cairosvg # Optionnel : rastérisation des logos SVG, que PIL ne sait pas ouvrir
+except ImportError:
+    cairosvg = None
+
+API_BASE_URL = "https://api.football-data.org/v4"
+CACHE_TTL = 3600 # Durée de validité par défaut du cache API (1 heure)
+LOGO_CACHE_TTL = 604800 # Durée de validité des logos en cache fichier (7 jours)
+ATLAS_COLUMNS = 10 # Logos par ligne dans l'atlas d'une compétition
+LOGO_RETRY_BACKOFF = 3600 # Délai avant de retenter un logo en échec, doublé à chaque nouvel échec
+LOGO_FAILURES_FILE = 'logo_failures.json' # Échecs de logos connus (dans le dossier des images)
+LOGO_PLACEHOLDER_SIZE = 100 # Côté du logo de remplacement généré, en pixels
+
+# Durée de validité par famille d'endpoints, en secondes (None = jamais obsolète)
+CACHE_TTL_POLICY = [
+    (re.compile(r'^/competitions$'), 7 * 86400),                 # Liste des compétitions
+    (re.compile(r'^/competitions/[^/]+$'), 86400),               # Détail d'une compétition
+    (re.compile(r'^/competitions/[^/]+/standings$'), 3600),      # Change après chaque match
+    (re.compile(r'^/competitions/[^/]+/scorers$'), 3600),
+    (re.compile(r'^/competitions/[^/]+/matches$'), 3600),
+    (re.compile(r'^/teams/[^/]+/matches$'), 3600),
+    (re.compile(r'^/matches/[^/]+$'), 3600),                     # Détail d'un match
+    (re.compile(r'^/matches$'), 900),                            # Matchs de la semaine
+]
+
+# Durée de validité selon le statut des matchs contenus dans une réponse
+MATCH_STATUS_TTL = {
+    'IN_PLAY': 30,
+    'LIVE': 30,
+    'PAUSED': 60,         # Mi-temps
+    'SUSPENDED': 300,
+    'POSTPONED': 6 * 3600,
+    'FINISHED': None,     # Résultat définitif
+    'AWARDED': None,
+    'CANCELLED': None,
+}
+MIN_CACHE_TTL = 30 # Plancher pour les matchs sur le point de commencer
+# Réponses dont la liste de matchs est figée : un match seul, une partition de jour (passé)
+SINGLE_MATCH_ENDPOINT = re.compile(r'^/matches/[^/]+$')
+DAY_PARTITION_KEY = re.compile(r'^_matches_date-(\d{4}-\d{2}-\d{2})$')
+MAX_DATE_RANGE_DAYS = 10 # Plage maximale acceptée par /matches (dateFrom/dateTo)
+SCORER_LIMITS = (10, 20, 50, 100) # Tailles de classements des buteurs recherchées dans le cache
+
+# Coefficients Golden Boot par championnat
+GOLDEN_BOOT_COEFFICIENTS = {
+    # Top 5 (coefficient 2.0)
+    'PL': 2.0,    # Premier League
+    'PD': 2.0,    # La Liga
+    'BL1': 2.0,   # Bundesliga
+    'SA': 2.0,    # Serie A
+    'FL1': 2.0,   # Ligue 1
+
+    # Championnats intermédiaires (coefficient 1.5)
+    'DED': 1.5,   # Eredivisie
+    'PPL': 1.5,   # Primeira Liga
+    'BJL': 1.5,   # Jupiler Pro League
+    'RPL': 1.5,   # Russian Premier League
+
+    # Championnats plus faibles (coefficient 1.0)
+    'SSL': 1.0,   # Super League
+    'EL1': 1.0,   # Liga I
+    'CL': 1.0     # Champions League (coefficient 1.0 car c'est une compétition internationale)
+}
+
+# Priorités des requêtes API (plus petit = servi en premier)
+PRIORITY_INTERACTIVE = 0   # Données de la vue actuellement affichée
+PRIORITY_BACKGROUND = 10   # Préchargement, agrégations en tâche de fond
+
+
+class RateLimiter:
+    """Limiteur de débit à seau de jetons, partagé entre threads, avec file de priorité.
+
+    Les appelants en attente sont servis par priorité croissante puis par ordre d'arrivée.
+    """
+
+    def __init__(self, requests_per_minute=10, burst=None):
+        self.rate = requests_per_minute / 60.0 # Jetons par seconde
+        self.capacity = float(burst or requests_per_minute)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0 # Pause imposée par le serveur (429 / quota épuisé)
+        self._waiting = [] # Tas de tickets (priorité, ordre d'arrivée)
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def _wait_time(self, now):
+        """Secondes avant qu'un jeton soit disponible (verrou déjà acquis)"""
+        self._refill(now)
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def try_acquire(self, priority=PRIORITY_INTERACTIVE):
+        """Prend un jeton sans bloquer ; retourne 0 en cas de succès, sinon le délai à attendre.
+
+        Les appelants bloqués dans acquire() de priorité égale ou supérieure passent en premier.
+        """
+        with self._cond:
+            wait = self._wait_time(time.monotonic())
+            if self._waiting and self._waiting[0][0] <= priority:
+                return max(wait, 0.05) # Laisser la main au thread en attente
+            if wait > 0:
+                return wait
+            self.tokens -= 1
+            return 0.0
+
+    def acquire(self, priority=PRIORITY_INTERACTIVE):
+        """Bloque jusqu'à obtenir un jeton, en respectant l'ordre de priorité"""
+        with self._cond:
+            ticket = (priority, next(self._counter))
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    wait = self._wait_time(time.monotonic())
+                    if self._waiting[0] == ticket and wait <= 0:
+                        self.tokens -= 1
+                        return
+                    # Le premier de la file réveille les autres en sortant
+                    self._cond.wait(timeout=wait if wait > 0 else None)
+            finally:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+
+    def available(self):
+        """Jetons utilisables immédiatement (0 pendant une pause imposée ou si des appelants attendent)"""
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self.blocked_until or self._waiting:
+                return 0.0
+            return self.tokens
+
+    def update_from_headers(self, headers):
+        """Synchronise le seau avec le quota annoncé par football-data.org"""
+        available = _parse_seconds(headers.get('X-Requests-Available-Minute'))
+        reset = _parse_seconds(headers.get('X-RequestCounter-Reset'))
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            if available is not None:
+                self.tokens = min(self.tokens, available)
+                if available <= 0 and reset:
+                    self.blocked_until = max(self.blocked_until, now + reset)
+            self._cond.notify_all()
+
+    def penalize(self, retry_after):
+        """Suspend toutes les requêtes pendant retry_after secondes (réponse 429)"""
+        with self._cond:
+            now = time.monotonic()
+            self.tokens = 0.0
+            self.last_refill = now
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+            self._cond.notify_all()
+
+
+class LRUCache:
+    """Cache mémoire borné des réponses API décodées, avec expiration et compteurs.
+
+    on_evict(clé), s'il est fourni, est appelé pour chaque entrée évincée ou invalidée.
+    """
+
+    def __init__(self, max_entries=128, on_evict=None):
+        self.max_entries = max_entries
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict() # clé -> (données, date de récupération, TTL)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Retourne les données si elles sont présentes et encore valides, sinon None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and _is_fresh(entry[1], entry[2]):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            return None
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def get_stale(self, key):
+        """Retourne les données même expirées (repli en cas d'erreur API)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else None
+
+    def replace_data(self, key, old_data, data):
+        """Remplace les données d'une entrée (même date, même TTL) si elles sont toujours old_data"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is old_data:
+                self._entries[key] = (data,) + entry[1:]
+
+    def put(self, key, data, fetched_at, ttl):
+        with self._lock:
+            self._entries[key] = (data, fetched_at, ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted_key, _ = self._entries.popitem(last=False) # Éviction du moins récemment utilisé
+                if self.on_evict:
+                    self.on_evict(evicted_key)
+
+    def invalidate(self, key):
+        with self._lock:
+            if self._entries.pop(key, None) is not None and self.on_evict:
+                self.on_evict(key)
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'entries': len(self._entries), 'max_entries': self.max_entries}
+
+
+class MatchIndex:
+    """Index mémoire des matchs vus dans les réponses de l'API.
+
+    Les matchs sont indexés par id, équipe, compétition/journée, date UTC et statut. Une
+    « couverture » retient quelles vues ont été reçues complètes (saison d'une compétition,
+    journée, matchs d'une équipe, jour calendaire) et jusqu'à quand elles restent valides.
+    Comme pour EntityStore, chaque réponse (owner, la clé du cache mémoire) compte une
+    référence sur ses matchs et possède les vues qu'elle couvre ; release(owner) à son
+    éviction retire les vues et les matchs qui ne sont plus portés par aucune réponse.
+    """
+
+    def __init__(self):
+        self._matches = {} # id -> match
+        self._match_keys = {} # id -> entrées d'index occupées par le match
+        self._by_team = defaultdict(set)
+        self._by_competition = defaultdict(set) # code -> ids
+        self._by_matchday = defaultdict(set) # (code, journée) -> ids
+        self._by_date = defaultdict(set) # 'AAAA-MM-JJ' -> ids
+        self._by_status = defaultdict(set)
+        self._competitions = {} # code -> compétition (en-tête des réponses)
+        self._coverage = {} # vue complète -> (date de récupération, TTL)
+        self._coverage_owners = {} # vue complète -> réponse qui la couvre
+        self._refs = defaultdict(int) # id -> nombre de réponses qui contiennent le match
+        self._owners = {} # réponse -> (ids de ses matchs, vues qu'elle couvre)
+        self._lock = threading.Lock()
+
+    def add_payload(self, endpoint, data, fetched_at, ttl, owner):
+        """Indexe les matchs d'une réponse et enregistre la vue qu'elle couvre"""
+        matches = _extract_matches(data)
+        if not matches and not (isinstance(data, dict) and isinstance(data.get('matches'), list)):
+            return # Pas une liste de matchs (une liste vide couvre quand même sa vue, ex. jour sans match)
+        endpoint_match = re.match(r'^/competitions/([^/]+)/matches$', endpoint)
+        endpoint_code = endpoint_match.group(1) if endpoint_match else None
+        with self._lock:
+            if endpoint_code and isinstance(data.get('competition'), dict):
+                self._competitions[endpoint_code] = data['competition']
+            ids = set()
+            for match in matches:
+                self._add_match(match, endpoint_code)
+                if match.get('id') is not None:
+                    ids.add(match['id'])
+            views = self._covered_views(endpoint, data, endpoint_code)
+            for view in views:
+                self._coverage[view] = (fetched_at, ttl)
+                self._coverage_owners[view] = owner
+            for match_id in ids:
+                self._refs[match_id] += 1
+            self._release_locked(owner) # Réponse remplacée : ses anciennes références sont libérées
+            self._owners[owner] = (ids, views)
+
+    def release(self, owner):
+        """Retire les vues et les matchs d'une réponse évincée du cache mémoire"""
+        with self._lock:
+            self._release_locked(owner)
+
+    def _release_locked(self, owner):
+        ids, views = self._owners.pop(owner, ((), ()))
+        for view in views:
+            if self._coverage_owners.get(view) == owner: # Pas recouverte depuis par une autre réponse
+                del self._coverage_owners[view]
+                self._coverage.pop(view, None)
+        for match_id in ids:
+            self._refs[match_id] -= 1
+            if self._refs[match_id] <= 0:
+                del self._refs[match_id]
+                self._matches.pop(match_id, None)
+                for index, key in self._match_keys.pop(match_id, ()):
+                    index[key].discard(match_id)
+                    if not index[key]:
+                        del index[key]
+
+    def _add_match(self, match, default_code):
+        match_id = match.get('id')
+        if match_id is None:
+            return
+        current = self._matches.get(match_id)
+        if current is not None:
+            # Ne pas remplacer par une version plus ancienne du même match
+            if (match.get('lastUpdated') or '') < (current.get('lastUpdated') or ''):
+                return
+            # Retirer l'ancienne version des index (son statut ou sa date ont pu changer)
+            for index, key in self._match_keys.pop(match_id):
+                index[key].discard(match_id)
+        self._matches[match_id] = match
+
+        keys = [(self._by_status, match.get('status'))]
+        code = (match.get('competition') or {}).get('code') or default_code
+        if code:
+            keys.append((self._by_competition, code))
+            keys.append((self._by_matchday, (code, match.get('matchday'))))
+        for side in ('homeTeam', 'awayTeam'):
+            team_id = (match.get(side) or {}).get('id')
+            if team_id is not None:
+                keys.append((self._by_team, team_id))
+        if match.get('utcDate'):
+            keys.append((self._by_date, match['utcDate'][:10]))
+        for index, key in keys:
+            index[key].add(match_id)
+        self._match_keys[match_id] = keys
+
+    def _covered_views(self, endpoint, data, endpoint_code):
+        """Vues complètes contenues dans une réponse, d'après l'endpoint et ses filtres"""
+        filters = data.get('filters') or {}
+        if filters.get('status') or filters.get('competitions') or filters.get('limit'):
+            return [] # Réponse partielle : ses matchs sont indexés mais ne couvrent rien
+        if endpoint_code:
+            if filters.get('matchday'):
+                return [('matchday', endpoint_code, int(filters['matchday']))]
+            if not filters.get('dateFrom'):
+                return [('competition', endpoint_code)]
+            return []
+        team_match = re.match(r'^/teams/([^/]+)/matches$', endpoint)
+        if team_match and not filters.get('dateFrom'):
+            return [('team', int(team_match.group(1)))]
+        if endpoint == '/matches' and filters.get('dateFrom') and filters.get('dateTo'):
+            return [('date', day) for day in _days_between(filters['dateFrom'], filters['dateTo'])]
+        return []
+
+    def _covers(self, view):
+        entry = self._coverage.get(view)
+        return entry is not None and _is_fresh(*entry)
+
+    def _collect(self, ids):
+        return sorted((self._matches[match_id] for match_id in ids),
+                      key=lambda m: (m.get('utcDate') or '', m.get('id')))
+
+    def competition_matches(self, code, matchday=None, status=None, team_id=None):
+        """Réponse construite depuis l'index si la vue demandée est couverte, sinon None"""
+        with self._lock:
+            if self._covers(('competition', code)):
+                ids = self._by_competition.get(code, ())
+            elif matchday and self._covers(('matchday', code, int(matchday))):
+                ids = self._by_matchday.get((code, int(matchday)), ())
+            else:
+                return None
+            data = {'filters': {}, 'matches': self._collect(ids)}
+            if code in self._competitions:
+                data['competition'] = self._competitions[code]
+        return _slice_matches(data, matchday or None, team_id=team_id, status=status)
+
+    def team_matches(self, team_id, status=None):
+        """Matchs d'une équipe depuis l'index si ses matchs ont été reçus complets, sinon None"""
+        with self._lock:
+            if not self._covers(('team', int(team_id))):
+                return None
+            data = {'filters': {}, 'matches': self._collect(self._by_team.get(int(team_id), ()))}
+        return _slice_matches(data, status=status)
+
+    def date_matches(self, date_from, date_to):
+        """Matchs entre deux dates (incluses) si tous les jours sont couverts, sinon None"""
+        days = _days_between(date_from, date_to)
+        with self._lock:
+            if not all(self._covers(('date', day)) for day in days):
+                return None
+            ids = set()
+            for day in days:
+                ids.update(self._by_date.get(day, ()))
+            data = {'filters': {'dateFrom': date_from, 'dateTo': date_to}, 'matches': self._collect(ids)}
+        return _slice_matches(data)
+
+    def get(self, match_id):
+        with self._lock:
+            return self._matches.get(match_id)
+
+    def stats(self):
+        with self._lock:
+            return {'matches': len(self._matches),
+                    'covered_views': sum(1 for view in self._coverage if self._covers(view))}
+
+
+# Clés des réponses de l'API qui contiennent une entité (ou une liste d'entités) identifiée par 'id'
+ENTITY_KEYS = {
+    'matches': 'match',
+    'homeTeam': 'team',
+    'awayTeam': 'team',
+    'team': 'team',
+    'player': 'player',
+}
+
+
+class EntityStore:
+    """Entités canoniques (matchs, équipes, joueurs) partagées par les réponses en mémoire.
+
+    Chaque réponse est normalisée : ses matchs, équipes et joueurs sont remplacés par la version
+    la plus récente connue, fusionnée avec celle reçue. Une entité n'est jamais modifiée en
+    place : une mise à jour crée un nouvel objet, et resolve() rend à la lecture une copie de
+    la réponse avec les versions à jour (les vues déjà affichées gardent leurs objets, lus sans
+    verrou depuis Tk). Une mise à jour venue de n'importe quel endpoint est ainsi visible dans
+    toutes les réponses en mémoire sans nouvelle requête.
+    Chaque réponse (owner, la clé du cache mémoire) compte une référence sur ses entités ;
+    release(owner) à son éviction libère celles qui ne sont plus utilisées.
+    """
+
+    def __init__(self):
+        self._entities = {} # (type, id) -> dict canonique
+        self._refs = defaultdict(int) # (type, id) -> nombre de réponses qui la contiennent
+        self._owners = {} # clé de la réponse -> ensemble des (type, id) qu'elle contient
+        self._version = 0 # Incrémenté à chaque remplacement d'entité
+        self._replaced_at = {} # (type, id) -> version de son dernier remplacement
+        self._owner_versions = {} # clé de la réponse -> version de ses entités
+        self._lock = threading.Lock()
+
+    def normalize(self, data, owner):
+        """Retourne une copie de la réponse dont les entités sont les versions canoniques"""
+        with self._lock:
+            # Détail d'un match : la réponse est elle-même le match
+            kind = 'match' if isinstance(data, dict) and 'homeTeam' in data else None
+            refs = set()
+            normalized = self._normalize(data, kind, refs)
+            for ref in refs:
+                self._refs[ref] += 1
+            self._release_locked(owner) # Réponse remplacée : ses anciennes références sont libérées
+            self._owners[owner] = refs
+            self._owner_versions[owner] = self._version
+            return normalized
+
+    def resolve(self, owner, data):
+        """Réponse en mémoire avec ses entités à jour : data elle-même si aucune n'a été remplacée
+        depuis sa normalisation, sinon une copie (data n'est jamais modifiée)"""
+        with self._lock:
+            seen = self._owner_versions.get(owner)
+            if seen is None or seen == self._version:
+                return data
+            self._owner_versions[owner] = self._version
+            if all(self._replaced_at.get(ref, 0) <= seen for ref in self._owners.get(owner, ())):
+                return data
+            kind = 'match' if isinstance(data, dict) and 'homeTeam' in data else None
+            return self._resolve(data, kind)
+
+    def _resolve(self, value, kind):
+        if isinstance(value, list):
+            items = [self._resolve(item, kind) for item in value]
+            return value if all(new is old for new, old in zip(items, value)) else items
+        if not isinstance(value, dict):
+            return value
+        if kind and value.get('id') is not None:
+            value = self._entities.get((kind, value['id']), value)
+        children = {key: self._resolve(child, ENTITY_KEYS.get(key))
+                    for key, child in value.items() if isinstance(child, (dict, list))}
+        if all(child is value[key] for key, child in children.items()):
+            return value
+        return {**value, **children}
+
+    def release(self, owner):
+        """Libère les entités d'une réponse retirée du cache mémoire"""
+        with self._lock:
+            self._release_locked(owner)
+
+    def _release_locked(self, owner):
+        self._owner_versions.pop(owner, None)
+        for ref in self._owners.pop(owner, ()):
+            self._refs[ref] -= 1
+            if self._refs[ref] <= 0:
+                del self._refs[ref]
+                self._entities.pop(ref, None)
+                self._replaced_at.pop(ref, None)
+
+    def _normalize(self, value, kind, refs):
+        if isinstance(value, list):
+            return [self._normalize(item, kind, refs) for item in value]
+        if not isinstance(value, dict):
+            return value
+        # Nouveau dict : la réponse reçue (parfois déjà partagée) n'est pas modifiée
+        value = {key: self._normalize(child, ENTITY_KEYS.get(key), refs) if isinstance(child, (dict, list)) else child
+                 for key, child in value.items()}
+        if kind and value.get('id') is not None:
+            refs.add((kind, value['id']))
+            return self._merge(kind, value)
+        return value
+
+    def _merge(self, kind, incoming):
+        key = (kind, incoming['id'])
+        canonical = self._entities.get(key)
+        if canonical is None:
+            self._entities[key] = incoming
+            return incoming
+        if kind == 'match' and (incoming.get('lastUpdated') or '') < (canonical.get('lastUpdated') or ''):
+            # Version plus ancienne : ne compléter que les champs absents
+            merged = {**incoming, **canonical}
+        else:
+            merged = {**canonical, **incoming}
+        if merged == canonical:
+            return canonical
+        self._entities[key] = merged # Remplacement, jamais de modification en place
+        self._version += 1
+        self._replaced_at[key] = self._version
+        return merged
+
+    def get(self, kind, entity_id):
+        with self._lock:
+            return self._entities.get((kind, entity_id))
+
+    def stats(self):
+        with self._lock:
+            counts = {}
+            for kind, _ in self._entities:
+                counts[kind] = counts.get(kind, 0) + 1
+            return counts
+
+
+def _is_fresh(fetched_at, ttl):
+    """Indique si une entrée récupérée à fetched_at est encore valide (ttl None = toujours)"""
+    return ttl is None or time.time() - fetched_at < ttl
+
+
+def _has_fixed_match_set(endpoint, cache_key=None):
+    """Vrai si aucun match ne peut s'ajouter à la réponse (match seul, journée, jour passé)"""
+    if SINGLE_MATCH_ENDPOINT.match(endpoint):
+        return True
+    if cache_key is None:
+        return False
+    day = DAY_PARTITION_KEY.match(cache_key)
+    if day:
+        return day.group(1) < datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    return '_matchday-' in cache_key
+
+
+def _extract_matches(data):
+    """Retourne la liste des matchs contenus dans une réponse API (liste ou détail)"""
+    if not isinstance(data, dict):
+        return []
+    if isinstance(data.get('matches'), list):
+        return data['matches']
+    if isinstance(data.get('match'), dict):
+        return [data['match']]
+    if 'status' in data and 'homeTeam' in data: # Détail de match au format v4
+        return [data]
+    return []
+
+
+def _is_settled(data):
+    """Vrai si la réponse contient des matchs et que leurs résultats sont tous définitifs"""
+    matches = _extract_matches(data)
+    return bool(matches) and all(MATCH_STATUS_TTL.get(match.get('status'), 0) is None for match in matches)
+
+
+def _parse_utc_date(value):
+    """Convertit une date ISO de l'API ('2025-05-07T19:00:00Z') en datetime UTC"""
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+
+
+def _days_between(date_from, date_to):
+    """Jours 'AAAA-MM-JJ' de date_from à date_to inclus"""
+    start = datetime.strptime(date_from[:10], '%Y-%m-%d')
+    end = datetime.strptime(date_to[:10], '%Y-%m-%d')
+    return [(start + timedelta(days=i)).strftime('%Y-%m-%d') for i in range((end - start).days + 1)]
+
+
+def _next_day(day):
+    return (datetime.strptime(day, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+
+
+def _merge_match_changes(base, changed_matches):
+    """Fusionne des matchs récents dans une réponse complète, d'après leur lastUpdated.
+
+    Retourne la nouvelle réponse (base n'est pas modifiée) et le décompte des changements.
+    """
+    counts = {'added': 0, 'updated': 0, 'unchanged': 0}
+    matches = list(base.get('matches', []))
+    positions = {match.get('id'): i for i, match in enumerate(matches)}
+    for match in changed_matches:
+        position = positions.get(match.get('id'))
+        if position is None:
+            positions[match.get('id')] = len(matches)
+            matches.append(match)
+            counts['added'] += 1
+        elif (match.get('lastUpdated') or '') > (matches[position].get('lastUpdated') or ''):
+            matches[position] = match
+            counts['updated'] += 1
+        else:
+            counts['unchanged'] += 1
+    if counts['added']:
+        matches.sort(key=lambda m: (m.get('utcDate') or '', m.get('id')))
+    return _slice_matches(dict(base, matches=matches)), counts
+
+
+def _assemble_days(date_from, date_to, day_payloads):
+    """Reconstitue une réponse /matches à partir des partitions journalières"""
+    matches = []
+    for day in _days_between(date_from, date_to):
+        matches.extend(day_payloads[day].get('matches', []))
+    matches.sort(key=lambda m: (m.get('utcDate') or '', m.get('id')))
+    return _slice_matches({'filters': {'dateFrom': date_from, 'dateTo': date_to}, 'matches': matches})
+
+
+def _parse_seconds(value):
+    """Convertit une valeur d'en-tête numérique, None si absente ou invalide"""
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _slice_matches(data, matchday=None, team_id=None, status=None):
+    """Extrait localement une vue (journée, équipe, statuts) d'une réponse « saison complète ».
+
+    Retourne une nouvelle réponse au format de l'API, sans modifier la réponse partagée du cache.
+    """
+    if not isinstance(data, dict) or 'matches' not in data:
+        return data
+
+    statuses = set(status.split(',')) if status else None
+    matches = [
+        match for match in data['matches']
+        if (matchday is None or match.get('matchday') == int(matchday))
+        and (team_id is None or int(team_id) in (match.get('homeTeam', {}).get('id'),
+                                                 match.get('awayTeam', {}).get('id')))
+        and (statuses is None or match.get('status') in statuses)
+    ]
+
+    filters = dict(data.get('filters', {}))
+    if matchday is not None:
+        filters['matchday'] = str(matchday)
+    if status:
+        filters['status'] = status
+    dates = sorted(match['utcDate'][:10] for match in matches if match.get('utcDate'))
+    result_set = {
+        'count': len(matches),
+        'first': dates[0] if dates else None,
+        'last': dates[-1] if dates else None,
+        'played': sum(1 for match in matches if match.get('status') == 'FINISHED'),
+    }
+    return dict(data, filters=filters, resultSet=result_set, matches=matches)
+
+
+def _slice_scorers(data, limit):
+    """Les limit premiers buteurs d'une réponse plus longue, au format de l'API"""
+    if not isinstance(data, dict) or 'scorers' not in data:
+        return data
+    scorers = data['scorers'][:limit]
+    return dict(data, count=len(scorers), filters=dict(data.get('filters', {}), limit=limit), scorers=scorers)
+
+
+def _filter_competitions(data):
+    """Retire de la liste des compétitions celles non gérées par l'application"""
+    excluded_codes = ['WC', 'CL', 'EC','CLI','BSA']
+
+    # Filtrer les compétitions
+    if isinstance(data, dict) and 'competitions' in data:
+        filtered_competitions = [
+            comp for comp in data.get('competitions', [])
+            if comp.get('code') not in excluded_codes
+        ]
+        return filtered_competitions
+    elif isinstance(data, dict) and 'error' in data:
+         print(f"Erreur API lors de la récupération des compétitions: {data['error']}")
+         return {"error": data['error']} # Retourner l'erreur pour la gestion UI
+    else:
+        print("Réponse inattendue de l'API pour les compétitions.")
+        return {"error": "Réponse inattendue de l'API"}
+
+
+def _decode_logo(content):
+    """Image PIL d'un logo téléchargé ; les SVG sont rastérisés si cairosvg est installé"""
+    try:
+        return Image.open(BytesIO(content))
+    except Exception:
+        if cairosvg is None or b'<svg' not in content[:1024]:
+            raise
+    png = cairosvg.svg2png(bytestring=content, output_width=LOGO_PLACEHOLDER_SIZE * 2)
+    return Image.open(BytesIO(png))
+
+
+def _placeholder_logo(size=LOGO_PLACEHOLDER_SIZE):
+    """Logo neutre (écusson gris) affiché à la place d'un logo introuvable ou illisible"""
+    image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    margin = size // 10
+    draw.ellipse((margin, margin, size - margin, size - margin),
+                 fill=(200, 200, 200, 255), outline=(140, 140, 140, 255), width=max(1, size // 25))
+    return image
+
+
+def _golden_boot_entries(comp_code, scorers_data):
+    """Buteurs d'une compétition enrichis de leur coefficient et de leurs points Golden Boot"""
+    entries = []
+    if isinstance(scorers_data, dict) and 'scorers' in scorers_data:
+        coefficient = GOLDEN_BOOT_COEFFICIENTS[comp_code]
+        for scorer in scorers_data['scorers']:
+            # Copier pour ne pas modifier la réponse partagée du cache mémoire
+            scorer = dict(scorer)
+            # Ajouter les informations nécessaires
+            scorer['competition'] = comp_code
+            scorer['coefficient'] = coefficient
+            # Calculer les points Golden Boot
+            goals = scorer.get('goals', 0)
+            scorer['golden_boot_points'] = goals * coefficient
+            entries.append(scorer)
+    return entries
+
+
+def _rank_golden_boot(all_scorers):
+    """Trie les buteurs par points Golden Boot et retourne les 20 meilleurs"""
+    ranking = sorted(all_scorers, key=lambda x: x.get('golden_boot_points', 0), reverse=True)
+    return {'scorers': ranking[:20]}
+
 
 class FootballDataAPI:
 
 
-    def __init__(self, api_key, cache_dir='cache', image_cache_dir='image_cache'):
+    def __init__(self, api_key, cache_dir='cache', image_cache_dir='image_cache',
+                 pool_size=10, max_retries=3, requests_per_minute=10, memory_cache_size=128,
+                 stale_while_revalidate=False, cache_backend='json', cache_format='json',
+                 cache_max_bytes=None, cache_max_entries=None,
+                 image_cache_max_bytes=None, image_cache_max_entries=None, base_url=API_BASE_URL,
+                 bulk_season=False, scorers_fetch_limit=None):
         """Initialisation de la classe avec la clé API"""
         self.api_key = api_key
-        self.base_url = "https://api.football-data.org/v4"
+        self.base_url = base_url
         self.headers = {"X-Auth-Token": self.api_key}
         self.cache_dir = cache_dir
         self.image_cache_dir = image_cache_dir
         self.logo_cache = {}
 
+        # Session HTTP partagée : connexions keep-alive réutilisées par tous les threads
+        self.session = self._create_session(pool_size, max_retries)
+
+        # Limiteur de débit client (quota gratuit : 10 requêtes/minute)
+        self.rate_limiter = RateLimiter(requests_per_minute)
+        self._local = threading.local() # Priorité courante, propre à chaque thread
+
+        # Stockage persistant du cache : 'json' (un fichier par entrée) ou 'sqlite',
+        # au format lisible ('json') ou compact et compressé ('json.gz')
+        self.cache_backend = create_cache_backend(cache_backend, cache_dir, cache_format,
+                                                  cache_max_bytes, cache_max_entries)
+        # Dossier des logos, borné lui aussi (éviction des moins récemment utilisés)
+        self.image_store = ImageDirectoryCache(image_cache_dir, image_cache_max_bytes, image_cache_max_entries)
+
+        # Matchs, équipes et joueurs uniques, partagés par les réponses en mémoire
+        self.entity_store = EntityStore()
+
+        # Index des matchs des réponses en mémoire (équipe, journée, date, statut)
+        self.match_index = MatchIndex()
+
+        # Réponses décodées gardées en mémoire devant le cache disque ; une réponse évincée
+        # libère ses entités et ses entrées d'index
+        self.memory_cache = LRUCache(memory_cache_size, on_evict=self._forget_memory_entry)
+
+        # Mode « stale-while-revalidate » : servir l'entrée expirée et rafraîchir en fond
+        self.stale_while_revalidate = stale_while_revalidate
+
+        # Mode « saison complète » : une seule requête par compétition, journées et statuts
+        # extraits localement de la réponse en cache
+        self.bulk_season = bulk_season
+
+        # Taille de classement des buteurs toujours demandée à l'API (None = celle de l'appel) :
+        # les classements plus courts sont extraits de la même réponse
+        self.scorers_fetch_limit = scorers_fetch_limit
+        self._scorer_limits = defaultdict(set) # Compétition -> tailles déjà demandées
+        self._scorer_limits_lock = threading.Lock() # Partagé par les threads et le client asynchrone
+
+        # Logos en échec : raison et date avant laquelle ne pas retenter (persistés sur disque)
+        self._logo_failures_lock = threading.Lock()
+        self._logo_failures = self._load_logo_failures()
+
+        # Requêtes en vol par clé de cache (coalescence des appels identiques)
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
         # Création des dossiers cache s'ils n'existent pas
         for directory in [cache_dir, image_cache_dir]:
             if not os.path.exists(directory):
                 os.makedirs(directory)
 
-    
+    def _create_session(self, pool_size, max_retries):
+        """Crée une session avec un pool de connexions par hôte et des retries automatiques"""
+        session = requests.Session()
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504), # Le 429 est géré par _make_request
+            allowed_methods=frozenset(['GET']),
+            raise_on_status=False # Laisser raise_for_status() produire l'erreur finale
+        )
+        # pool_maxsize = connexions conservées par hôte (API + serveur des logos)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size,
+                              max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def close(self):
+        """Ferme les connexions du pool HTTP"""
+        self.session.close()
+
+    @contextmanager
+    def request_priority(self, priority):
+        """Applique une priorité aux requêtes API émises par le thread courant"""
+        previous = self._current_priority()
+        self._local.priority = priority
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def _current_priority(self):
+        return getattr(self._local, 'priority', PRIORITY_INTERACTIVE)
+
+    def cache_stats(self):
+        """Statistiques du cache mémoire (succès, échecs, nombre d'entrées)"""
+        return self.memory_cache.stats()
+
+    def cache_usage(self):
+        """Utilisation des caches disque par famille d'endpoint : {famille: (entrées, octets)}"""
+        return {'api': self.cache_backend.stats(), 'images': self.image_store.stats()}
+
+    def prune_caches(self):
+        """Applique les limites de taille aux caches API et logos ; retourne le nombre d'entrées supprimées"""
+        return self.cache_backend.prune() + self.image_store.prune()
 
     def get_competitions(self):
         endpoint = "/competitions"
-        data = self._make_request(endpoint)
-
-        excluded_codes = ['WC', 'CL', 'EC','CLI','BSA']
-
-        # Filtrer les compétitions
-        if isinstance(data, dict) and 'competitions' in data:
-            filtered_competitions = [
-                comp for comp in data.get('competitions', [])
-                if comp.get('code') not in excluded_codes
-            ]
-            return filtered_competitions
-        elif isinstance(data, dict) and 'error' in data:
-             print(f"Erreur API lors de la récupération des compétitions: {data['error']}")
-             return {"error": data['error']} # Retourner l'erreur pour la gestion UI
-        else:
-            print("Réponse inattendue de l'API pour les compétitions.")
-            return {"error": "Réponse inattendue de l'API"}
+        return _filter_competitions(self._make_request(endpoint))
 
 
-    def get_competition_standings(self, competition_id):
+    def get_competition_standings(self, competition_id, on_refresh=None):
         """Récupère le classement d'une compétition"""
         endpoint = f"/competitions/{competition_id}/standings"
-        return self._make_request(endpoint)
+        return self._make_request(endpoint, on_refresh=on_refresh)
 
-    def get_competition_matches(self, competition_id, matchday=None):
-        """Récupère les matchs d'une compétition, éventuellement filtrés par journée"""
+    def get_competition_matches(self, competition_id, matchday=None, status=None):
+        """Récupère les matchs d'une compétition, éventuellement filtrés par journée et/ou statut"""
+        indexed = self.match_index.competition_matches(competition_id, matchday, status)
+        if indexed is not None:
+            return indexed
         endpoint = f"/competitions/{competition_id}/matches"
+        if self.bulk_season:
+            # Toute la saison en une requête, la vue demandée est extraite localement
+            return self._season_matches(competition_id, matchday or None, status=status)
         params = {}
         if matchday:
             params['matchday'] = matchday
+        if status:
+            params['status'] = status
         return self._make_request(endpoint, params)
 
-    def get_competition_scorers(self, competition_id, limit=10):
-        """Récupère les meilleurs buteurs d'une compétition"""
+    def get_competition_team_matches(self, competition_id, team_id, status=None):
+        """Matchs d'une équipe dans une compétition, extraits de la saison complète en cache"""
+        indexed = self.match_index.competition_matches(competition_id, status=status, team_id=team_id)
+        if indexed is not None:
+            return indexed
+        return self._season_matches(competition_id, team_id=team_id, status=status)
+
+    def _season_matches(self, competition_id, matchday=None, team_id=None, status=None):
+        """Vue extraite de la saison complète d'une compétition.
+
+        Le TTL du document est celui de son match le plus proche (30 s pendant un match en
+        direct) : une vue dont tous les matchs sont terminés est servie même expirée, sinon seule
+        la fenêtre récente est redemandée (sync_competition_matches) au lieu de toute la saison.
+        """
+        view, needs_sync = self._read_season_view(competition_id, matchday, team_id, status)
+        if view is None:
+            # Pas encore de saison en cache : téléchargement complet
+            endpoint = f"/competitions/{competition_id}/matches"
+            return _slice_matches(self._make_request(endpoint), matchday, team_id, status)
+        if not needs_sync:
+            return view
+        if self.stale_while_revalidate:
+            threading.Thread(target=self._sync_season_in_background, args=(competition_id,),
+                             daemon=True).start()
+            return view
+        result = self.sync_competition_matches(competition_id)
+        if isinstance(result, dict) and 'error' in result:
+            print(f"Synchronisation de {competition_id} impossible, vue en cache servie : {result['error']}")
+            return view
+        return self._read_season_view(competition_id, matchday, team_id, status)[0] or view
+
+    def _read_season_view(self, competition_id, matchday=None, team_id=None, status=None):
+        """Vue extraite de la saison en cache, même expirée.
+
+        Retourne (vue, à synchroniser) ; la vue est None si aucune saison n'est en cache.
+        """
+        endpoint = f"/competitions/{competition_id}/matches"
+        cache_key = self._get_cache_key(endpoint)
+        season = self._read_fresh_cache(cache_key, endpoint)
+        if season is not None:
+            return _slice_matches(season, matchday, team_id, status), False
+        season = self._read_stale_cache(cache_key) # Chargée depuis le disque par _read_fresh_cache
+        if season is None:
+            return None, True
+        view = _slice_matches(season, matchday, team_id, status)
+        return view, not _is_settled(view)
+
+    def _sync_season_in_background(self, competition_id):
+        try:
+            with self.request_priority(PRIORITY_BACKGROUND):
+                self.sync_competition_matches(competition_id)
+        except Exception as e:
+            print(f"Erreur lors de la synchronisation en arrière-plan de {competition_id}: {e}")
+
+    def get_competition_scorers(self, competition_id, limit=10, on_refresh=None):
+        """Récupère les meilleurs buteurs d'une compétition.
+
+        Un classement plus long encore valide en cache est réutilisé (tronqué à limit).
+        """
         endpoint = f"/competitions/{competition_id}/scorers"
-        params = {'limit': limit}
-        return self._make_request(endpoint, params)
+        cached = self._read_scorers_superset(endpoint, competition_id, limit)
+        if cached is not None:
+            return cached
+
+        fetch_limit = max(limit, self.scorers_fetch_limit or 0)
+        self._note_scorer_limit(competition_id, fetch_limit)
+        params = {'limit': fetch_limit}
+        if fetch_limit == limit:
+            return self._make_request(endpoint, params, on_refresh=on_refresh)
+        refresh = (lambda data: on_refresh(_slice_scorers(data, limit))) if on_refresh else None
+        return _slice_scorers(self._make_request(endpoint, params, on_refresh=refresh), limit)
+
+    def _note_scorer_limit(self, competition_id, limit):
+        """Retient une taille de classement demandée à l'API pour les lectures suivantes"""
+        with self._scorer_limits_lock:
+            self._scorer_limits[competition_id].add(limit)
+
+    def _read_scorers_superset(self, endpoint, competition_id, limit):
+        """Plus petit classement des buteurs valide en cache couvrant limit, tronqué ; sinon None"""
+        with self._scorer_limits_lock:
+            known = set(SCORER_LIMITS) | self._scorer_limits.get(competition_id, set())
+        limits = sorted(l for l in known if l >= limit)
+        for cached_limit in limits:
+            cache_key = self._get_cache_key(endpoint, {'limit': cached_limit})
+            if not self._has_cached(cache_key):
+                continue
+            data = self._read_fresh_cache(cache_key, endpoint)
+            if data is not None:
+                return data if cached_limit == limit else _slice_scorers(data, limit)
+        return None
 
     # --- NOUVELLE MÉTHODE ---
     def get_team_matches(self, team_id, status=None):
         """Récupère les matchs d'une équipe spécifique"""
+        indexed = self.match_index.team_matches(team_id, status)
+        if indexed is not None:
+            return indexed
         endpoint = f"/teams/{team_id}/matches"
         params = {}
         if status:
@@ -88,114 +995,507 @@ class FootballDataAPI:
              return None
 
         
-        image_path = os.path.join(self.image_cache_dir, f"team_{team_id}.png")
+        image = self._read_cached_logo(team_id)
+        if image is not None:
+            return image
 
+        # Échec récent pour cette URL : pas de nouvelle tentative avant la date prévue
+        if self._logo_failure(team_id, crest_url) is not None:
+            return _placeholder_logo()
+
+        # Si pas en cache ou erreur, télécharger
+        try:
+            print(f"Téléchargement du logo pour {team_id} depuis {crest_url}")
+            response = self.session.get(crest_url, headers=self._logo_headers(crest_url), timeout=10)
+            response.raise_for_status()
+            return self._store_logo(team_id, response.content)
+        except requests.exceptions.RequestException as e:
+            print(f"Erreur réseau lors du téléchargement du logo {team_id}: {e}")
+            reason = f"réseau : {e}"
+        except Exception as e:
+            print(f"Erreur générale lors du traitement/téléchargement du logo {team_id}: {e}")
+            reason = f"décodage : {e}"
+
+        self._record_logo_failure(team_id, crest_url, reason)
+        return _placeholder_logo() # Logo de remplacement si le logo ne peut être obtenu
+
+    def get_team_logo_thumbnail(self, team_id, crest_url, size=(30, 30)):
+        """Logo redimensionné à size, depuis le cache des miniatures (image_cache/team_{id}_{l}x{h}.png)"""
+        if not crest_url:
+            return None
+        thumbnail = self._read_cached_thumbnail(team_id, size)
+        if thumbnail is not None:
+            return thumbnail
+        image = self.get_team_logo(team_id, crest_url)
+        if image is None:
+            return None
+        return self._store_thumbnail(team_id, size, image)
+
+    def get_crest_atlas(self, competition_code, team_ids, size=(30, 30)):
+        """Atlas en cache des logos d'une compétition : une seule image et la position de chaque logo.
+
+        Retourne (image PIL, {team_id: (x, y)}), ou None si l'atlas (image_cache/atlas_{code}_{l}x{h}.png
+        et son index .json) est absent, ne contient pas toutes les équipes ou si un logo original a
+        changé depuis sa construction. Aucun logo n'est téléchargé : les miniatures chargées
+        ailleurs (en parallèle) sont assemblées ensuite par build_crest_atlas.
+        """
+        if not team_ids:
+            return None
+        return self._read_crest_atlas(competition_code, team_ids, size)
+
+    def _atlas_names(self, competition_code, size):
+        base_name = f"atlas_{competition_code}_{size[0]}x{size[1]}"
+        return base_name + '.png', base_name + '.json'
+
+    def _logo_signature(self, team_id):
+        """Date de modification du logo original (None s'il n'est plus en cache)"""
+        try:
+            return os.path.getmtime(self.image_store.path(f"team_{team_id}.png"))
+        except OSError:
+            return None
+
+    def _read_crest_atlas(self, competition_code, team_ids, size):
+        """Atlas en cache s'il contient toutes les équipes et que leurs logos n'ont pas changé"""
+        image_name, index_name = self._atlas_names(competition_code, size)
+        image_path = self.image_store.path(image_name)
+        try:
+            if time.time() - os.path.getmtime(image_path) >= LOGO_CACHE_TTL:
+                return None
+            with open(self.image_store.path(index_name), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        entries = index.get('teams', {})
+        offsets = {}
+        for team_id in team_ids:
+            entry = entries.get(str(team_id))
+            if entry is None:
+                return None
+            signature = self._logo_signature(team_id)
+            if signature is not None and signature != entry.get('mtime'):
+                return None # Logo re-téléchargé depuis la construction de l'atlas
+            if signature is None and not self._logo_failure_pending(team_id):
+                return None # Logo de remplacement : l'original peut être retenté
+            offsets[team_id] = (entry['x'], entry['y'])
+        try:
+            image = Image.open(image_path)
+            image.load()
+        except Exception as e:
+            print(f"Erreur lors de l'ouverture de l'atlas {image_name}: {e}")
+            return None
+        self.image_store.note_access(image_name)
+        self.image_store.note_access(index_name)
+        return image, offsets
+
+    def build_crest_atlas(self, competition_code, thumbnails, size=(30, 30)):
+        """Assemble les miniatures (team_id, image PIL) dans une seule image et enregistre son index"""
+        thumbnails = [(team_id, thumbnail) for team_id, thumbnail in thumbnails if thumbnail is not None]
+        if not thumbnails:
+            return None
+
+        width, height = size
+        columns = min(ATLAS_COLUMNS, len(thumbnails))
+        rows = (len(thumbnails) + columns - 1) // columns
+        atlas = Image.new('RGBA', (columns * width, rows * height), (0, 0, 0, 0))
+        offsets = {}
+        index = {'size': list(size), 'teams': {}}
+        for position, (team_id, thumbnail) in enumerate(thumbnails):
+            x, y = (position % columns) * width, (position // columns) * height
+            atlas.paste(thumbnail.convert('RGBA'), (x, y))
+            offsets[team_id] = (x, y)
+            index['teams'][str(team_id)] = {'x': x, 'y': y, 'mtime': self._logo_signature(team_id)}
+
+        image_name, index_name = self._atlas_names(competition_code, size)
+        try:
+            atlas.save(self.image_store.path(image_name))
+            with open(self.image_store.path(index_name), 'w', encoding='utf-8') as f:
+                json.dump(index, f)
+            self.image_store.note_saved(image_name)
+            self.image_store.note_saved(index_name)
+            print(f"Atlas de {len(offsets)} logos enregistré pour {competition_code}")
+        except Exception as e:
+            print(f"Erreur lors de l'enregistrement de l'atlas {image_name}: {e}")
+        return atlas, offsets
+
+    def _read_cached_thumbnail(self, team_id, size):
+        """Miniature en cache si elle correspond encore au logo original, sinon None"""
+        thumbnail_name = f"team_{team_id}_{size[0]}x{size[1]}.png"
+        thumbnail_path = self.image_store.path(thumbnail_name)
+        original_path = self.image_store.path(f"team_{team_id}.png")
+        try:
+            # La miniature porte la date de modification de l'original dont elle est issue
+            thumbnail_mtime = os.path.getmtime(thumbnail_path)
+            if time.time() - thumbnail_mtime >= LOGO_CACHE_TTL:
+                return None
+            if os.path.exists(original_path) and os.path.getmtime(original_path) != thumbnail_mtime:
+                return None # Logo original re-téléchargé depuis
+            self.image_store.note_access(thumbnail_name)
+            return Image.open(thumbnail_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Erreur lors de l'ouverture de la miniature {thumbnail_name}: {e}")
+            return None
+
+    def _store_thumbnail(self, team_id, size, image):
+        """Redimensionne un logo et enregistre la miniature à côté de l'original"""
+        thumbnail_name = f"team_{team_id}_{size[0]}x{size[1]}.png"
+        thumbnail_path = self.image_store.path(thumbnail_name)
+        thumbnail = image.resize(size, Image.Resampling.LANCZOS)
+        original_path = self.image_store.path(f"team_{team_id}.png")
+        if not os.path.exists(original_path):
+            return thumbnail # Logo de remplacement : rien à enregistrer, l'original sera retenté
+        try:
+            thumbnail.save(thumbnail_path)
+            original_mtime = os.path.getmtime(original_path)
+            os.utime(thumbnail_path, (time.time(), original_mtime))
+            self.image_store.note_saved(thumbnail_name)
+        except Exception as e:
+            print(f"Erreur lors de l'enregistrement de la miniature {thumbnail_name}: {e}")
+        return thumbnail
+
+    def _read_cached_logo(self, team_id):
+        """Logo depuis le cache fichier s'il est encore valide, sinon None"""
+        image_name = f"team_{team_id}.png"
+        image_path = self.image_store.path(image_name)
 
         if os.path.exists(image_path):
             try:
-
                  file_age = time.time() - os.path.getmtime(image_path)
-                 if file_age < 604800: # 7 jours
+                 if file_age < LOGO_CACHE_TTL:
+                    self.image_store.note_access(image_name)
                     return Image.open(image_path)
                  else:
                      print(f"Logo en cache fichier obsolète pour {team_id}, re-téléchargement.")
             except Exception as e:
                 print(f"Erreur lors de l'ouverture de l'image en cache fichier: {e}")
                 # Tenter de re-télécharger si l'ouverture échoue
+        return None
 
-        # Si pas en cache ou erreur, télécharger
+    def _load_logo_failures(self):
         try:
-            print(f"Téléchargement du logo pour {team_id} depuis {crest_url}")
-            response = requests.get(crest_url, headers={"X-Auth-Token": self.api_key} if 'football-data.org' in crest_url else {}) # Adapter headers si besoin
-            response.raise_for_status()
+            with open(self.image_store.path(LOGO_FAILURES_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
 
-            # Sauvegarder l'image
-            image = Image.open(BytesIO(response.content))
-            # Essayer de convertir en RGBA pour gérer la transparence potentielle des PNG/SVG
-            try:
-                image = image.convert("RGBA")
-            except Exception as conv_e:
-                print(f"Note : Impossible de convertir l'image {team_id} en RGBA : {conv_e}. Utilisation du format original.")
+    def _logo_failure(self, team_id, crest_url):
+        """Échec enregistré pour ce logo s'il interdit encore une nouvelle tentative, sinon None"""
+        with self._logo_failures_lock:
+            failure = self._logo_failures.get(str(team_id))
+        if failure is None or failure.get('url') != crest_url: # Nouvelle URL : nouvelle chance
+            return None
+        return failure if time.time() < failure.get('retry_after', 0) else None
 
-            image.save(image_path)
-            print(f"Logo sauvegardé pour {team_id} dans {image_path}")
-            return image
-        except requests.exceptions.RequestException as e:
-            print(f"Erreur réseau lors du téléchargement du logo {team_id}: {e}")
+    def _logo_failure_pending(self, team_id):
+        """Vrai si un échec empêche encore de retenter ce logo, quelle que soit son URL"""
+        with self._logo_failures_lock:
+            failure = self._logo_failures.get(str(team_id))
+        return failure is not None and time.time() < failure.get('retry_after', 0)
+
+    def _record_logo_failure(self, team_id, crest_url, reason):
+        """Enregistre un échec ; le délai avant la prochaine tentative double à chaque échec"""
+        with self._logo_failures_lock:
+            previous = self._logo_failures.get(str(team_id)) or {}
+            attempts = previous.get('attempts', 0) + 1 if previous.get('url') == crest_url else 1
+            delay = min(LOGO_RETRY_BACKOFF * 2 ** (attempts - 1), LOGO_CACHE_TTL)
+            self._logo_failures[str(team_id)] = {'url': crest_url, 'reason': reason, 'attempts': attempts,
+                                                 'retry_after': time.time() + delay}
+            self._save_logo_failures_locked()
+        print(f"Logo {team_id} en échec ({reason}), nouvelle tentative dans {delay // 60} min")
+
+    def _clear_logo_failure(self, team_id):
+        with self._logo_failures_lock:
+            if self._logo_failures.pop(str(team_id), None) is not None:
+                self._save_logo_failures_locked()
+
+    def _save_logo_failures_locked(self):
+        try:
+            with open(self.image_store.path(LOGO_FAILURES_FILE), 'w', encoding='utf-8') as f:
+                json.dump(self._logo_failures, f)
+        except OSError as e:
+            print(f"Erreur lors de l'enregistrement des échecs de logos: {e}")
+
+    def _logo_headers(self, crest_url):
+        """En-têtes du téléchargement d'un logo (clé API seulement pour football-data.org)"""
+        return {"X-Auth-Token": self.api_key} if 'football-data.org' in crest_url else {}
+
+    def _store_logo(self, team_id, content):
+        """Décode un logo téléchargé et l'enregistre dans le cache fichier"""
+        image_name = f"team_{team_id}.png"
+        image_path = self.image_store.path(image_name)
+
+        # Sauvegarder l'image
+        image = _decode_logo(content)
+        # Essayer de convertir en RGBA pour gérer la transparence potentielle des PNG/SVG
+        try:
+            image = image.convert("RGBA")
+        except Exception as conv_e:
+            print(f"Note : Impossible de convertir l'image {team_id} en RGBA : {conv_e}. Utilisation du format original.")
+
+        image.save(image_path)
+        self.image_store.note_saved(image_name)
+        self._clear_logo_failure(team_id)
+        print(f"Logo sauvegardé pour {team_id} dans {image_path}")
+        return image
+
+    def _make_request(self, endpoint, params=None, on_refresh=None):
+        """Effectue une requête à l'API avec gestion du cache.
+
+        En mode stale_while_revalidate, une entrée expirée est retournée immédiatement et
+        rafraîchie en arrière-plan ; on_refresh(data) est alors appelé (depuis un thread
+        de fond) si des données plus récentes ont été obtenues.
+        """
+        cache_key = self._get_cache_key(endpoint, params)
+
+        data = self._read_fresh_cache(cache_key, endpoint)
+        if data is not None:
+            return data
+
+        if self.stale_while_revalidate:
+            stale_data = self._read_stale_cache(cache_key)
+            if stale_data is not None:
+                threading.Thread(
+                    target=self._refresh_in_background,
+                    args=(endpoint, params, cache_key, stale_data, on_refresh),
+                    daemon=True
+                ).start()
+                return stale_data
+
+        return self._fetch_coalesced(endpoint, params, cache_key)
+
+    def _refresh_in_background(self, endpoint, params, cache_key, stale_data, on_refresh):
+        """Rafraîchit une entrée expirée et notifie l'appelant si les données ont changé"""
+        try:
+            with self.request_priority(PRIORITY_BACKGROUND):
+                data = self._fetch_coalesced(endpoint, params, cache_key)
+            # Contenu identique : 304, repli sur le cache suite à une erreur ou réponse inchangée
+            if on_refresh and data != stale_data and not (isinstance(data, dict) and 'error' in data):
+                on_refresh(data)
         except Exception as e:
-            print(f"Erreur générale lors du traitement/téléchargement du logo {team_id}: {e}")
+            print(f"Erreur lors du rafraîchissement en arrière-plan de {endpoint}: {e}")
 
-            return None # Retourner None si le logo ne peut être obtenu
+    def _fetch_coalesced(self, endpoint, params, cache_key, store=None):
+        """Interroge l'API avec une seule requête en vol par clé de cache"""
+        # Les appels concurrents pour la même clé attendent le résultat du premier
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[cache_key] = future
+        if not is_leader:
+            print(f"Requête déjà en cours pour {endpoint}, attente du résultat.")
+            return future.result()
 
-    def _make_request(self, endpoint, params=None):
-        """Effectue une requête à l'API avec gestion du cache"""
-        cache_file = self._get_cache_filename(endpoint, params)
+        try:
+            # Le cache a pu être rempli par une requête terminée entre-temps
+            data = self._read_fresh_cache(cache_key, endpoint)
+            if data is None:
+                data = self._fetch(endpoint, params, cache_key, store)
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
 
+    def _read_fresh_cache(self, cache_key, endpoint):
+        """Retourne les données du cache si elles sont encore valides, sinon None"""
+        data = self.memory_cache.get(cache_key)
+        if data is not None:
+            self.cache_backend.note_access(cache_key) # Pour l'éviction LRU, sans accès disque
+            return self._resolve_entities(cache_key, data)
+        if cache_key in self.memory_cache:
+            return None # Entrée expirée : le stockage disque n'est pas plus récent
 
-        if os.path.exists(cache_file):
-            try:
-                file_age = time.time() - os.path.getmtime(cache_file)
-                if file_age < 3600:  # 1 heure
-                    with open(cache_file, 'r', encoding='utf-8') as f:
-                        return json.load(f)
-                else:
-                    print(f"Cache API obsolète pour {endpoint}, requête API.")
-            except (IOError, json.JSONDecodeError) as e:
-                print(f"Erreur lecture/décodage cache API {cache_file}: {e}. Requête API.")
+        entry = self.cache_backend.get(cache_key)
+        if entry is None:
+            return None
+        ttl = self._get_ttl(endpoint, entry.data, cache_key)
+        data = self._remember(cache_key, endpoint, entry.data, entry.fetched_at, ttl)
+        if _is_fresh(entry.fetched_at, ttl):
+            return data
+        print(f"Cache API obsolète pour {endpoint}, requête API.")
+        return None
+
+    def _forget_memory_entry(self, cache_key):
+        self.entity_store.release(cache_key)
+        self.match_index.release(cache_key)
+
+    def _read_stale_cache(self, cache_key):
+        """Réponse en mémoire même expirée, avec ses entités à jour (None si absente)"""
+        data = self.memory_cache.get_stale(cache_key)
+        return self._resolve_entities(cache_key, data) if data is not None else None
+
+    def _resolve_entities(self, cache_key, data):
+        """Applique à une réponse en mémoire les entités mises à jour depuis par d'autres endpoints"""
+        resolved = self.entity_store.resolve(cache_key, data)
+        if resolved is not data:
+            self.memory_cache.replace_data(cache_key, data, resolved) # Copie faite une seule fois
+        return resolved
+
+    def _remember(self, cache_key, endpoint, data, fetched_at, ttl):
+        """Normalise une réponse, la garde en mémoire et indexe ses matchs"""
+        data = self.entity_store.normalize(data, cache_key)
+        self.memory_cache.put(cache_key, data, fetched_at, ttl)
+        self.match_index.add_payload(endpoint, data, fetched_at, ttl, cache_key)
+        return data
 
+    def _has_cached(self, cache_key):
+        """Indique si une entrée (même expirée) existe en mémoire ou sur disque"""
+        return cache_key in self.memory_cache or self.cache_backend.contains(cache_key)
 
+    def _get_ttl(self, endpoint, data, cache_key=None):
+        """Durée de validité d'une réponse selon sa famille d'endpoint et le statut de ses matchs.
 
+        Une réponse dont tous les matchs sont terminés n'expire jamais seulement si sa liste de
+        matchs est figée (_has_fixed_match_set) ; les listes qui s'allongent gardent le TTL de leur famille.
+        """
+        ttl = CACHE_TTL
+        for pattern, family_ttl in CACHE_TTL_POLICY:
+            if pattern.match(endpoint):
+                ttl = family_ttl
+                break
+
+        matches = _extract_matches(data)
+        if not matches:
+            # Jour passé sans match (trêve) : rien ne s'y ajoutera, inutile de le redemander
+            if cache_key and DAY_PARTITION_KEY.match(cache_key) and _has_fixed_match_set(endpoint, cache_key):
+                return None
+            return ttl
+
+        now = datetime.now(timezone.utc)
+        ttls = []
+        for match in matches:
+            status = match.get('status')
+            if status in MATCH_STATUS_TTL:
+                ttls.append(MATCH_STATUS_TTL[status])
+                continue
+            # Match programmé : expirer au coup d'envoi s'il tombe avant la fin du TTL
+            match_ttl = ttl
+            kickoff = _parse_utc_date(match.get('utcDate'))
+            if kickoff is not None:
+                until_kickoff = (kickoff - now).total_seconds()
+                if match_ttl is None or until_kickoff < match_ttl:
+                    match_ttl = max(MIN_CACHE_TTL, until_kickoff)
+            ttls.append(match_ttl)
+
+        finite_ttls = [t for t in ttls if t is not None]
+        if finite_ttls:
+            return min(finite_ttls)
+        # Tous terminés : jamais obsolète, sauf si d'autres matchs peuvent encore s'ajouter
+        return None if _has_fixed_match_set(endpoint, cache_key) else ttl
+
+    def _fetch(self, endpoint, params, cache_key, store=None):
+        """Interroge l'API, écrit la réponse dans le cache et gère les erreurs.
+
+        store(endpoint, cache_key, data, en-têtes) remplace l'écriture par défaut (_store_response).
+        """
         url = f"{self.base_url}{endpoint}"
         print(f"Requête API: {url} avec params {params}")
+        priority = self._current_priority()
+
+        headers = self._conditional_headers(cache_key)
         try:
-            # Ajouter un timeout aux requêtes
-            response = requests.get(url, headers=self.headers, params=params, timeout=10) # Timeout de 10s
+            for attempt in range(2):
+                # Attendre un jeton du limiteur (la vue affichée passe avant le fond)
+                self.rate_limiter.acquire(priority)
+                # Ajouter un timeout aux requêtes
+                response = self.session.get(url, headers=headers, params=params, timeout=10) # Timeout de 10s
+                self.rate_limiter.update_from_headers(response.headers)
+                if response.status_code != 429:
+                    break
+                wait_time = _parse_seconds(response.headers.get('Retry-After')) or 60 # Respecter l'en-tête si possible
+                self.rate_limiter.penalize(wait_time)
+                # Avec un cache (même obsolète) la vue n'attend pas ; sinon on réessaie une fois
+                if attempt or (priority == PRIORITY_INTERACTIVE and self._has_cached(cache_key)):
+                    break
+                print(f"Limite API atteinte. Nouvel essai dans {wait_time:.0f} secondes.")
             response.raise_for_status() #  une exception pour les codes 4xx/5xx
+            if response.status_code == 304:
+                return self._revalidate_cache(endpoint, cache_key)
             data = response.json()
-
-            try:
-                with open(cache_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=4) # Indent pour lisibilité
-            except IOError as e:
-                 print(f"Erreur écriture cache API {cache_file}: {e}")
-
-
-            return data
+            return (store or self._store_response)(endpoint, cache_key, data, response.headers)
         except requests.exceptions.Timeout:
             print(f"Erreur lors de la requête API: Timeout")
-            return self._fallback_to_cache_or_error(cache_file, "Timeout lors de la connexion à l'API.")
+            return self._fallback_to_cache_or_error(cache_key, "Timeout lors de la connexion à l'API.")
         except requests.exceptions.HTTPError as e:
              print(f"Erreur HTTP lors de la requête API: {e.response.status_code} - {e}")
 
              if e.response.status_code == 429:
-                  wait_time = int(e.response.headers.get('Retry-After', 60)) # Respecter l'en-tête si possible
-                  print(f"Limite API atteinte. Attente de {wait_time} secondes.")
-                  # On pourrait implémenter une attente ici, mais pour l'UI, il vaut mieux retourner une erreur.
-                  return self._fallback_to_cache_or_error(cache_file, f"Limite API atteinte. Réessayez dans {wait_time}s.")
+                  wait_time = _parse_seconds(e.response.headers.get('Retry-After')) or 60
+                  print(f"Limite API atteinte. Attente de {wait_time:.0f} secondes.")
+                  return self._fallback_to_cache_or_error(cache_key, f"Limite API atteinte. Réessayez dans {wait_time:.0f}s.")
              else:
-                  return self._fallback_to_cache_or_error(cache_file, f"Erreur HTTP {e.response.status_code}")
+                  return self._fallback_to_cache_or_error(cache_key, f"Erreur HTTP {e.response.status_code}")
         except requests.exceptions.RequestException as e:
             print(f"Erreur lors de la requête API: {e}")
-            return self._fallback_to_cache_or_error(cache_file, str(e))
+            return self._fallback_to_cache_or_error(cache_key, str(e))
         except json.JSONDecodeError as e:
             print(f"Erreur décodage JSON réponse API: {e}")
-            return self._fallback_to_cache_or_error(cache_file, "Réponse invalide de l'API.")
+            return self._fallback_to_cache_or_error(cache_key, "Réponse invalide de l'API.")
 
-    def _fallback_to_cache_or_error(self, cache_file, error_message):
+    def _conditional_headers(self, cache_key):
+        """En-têtes de la requête, conditionnelle si une entrée expirée et ses validateurs sont disponibles"""
+        headers = dict(self.headers)
+        if self._has_cached(cache_key):
+            validators = self.cache_backend.get_validators(cache_key)
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+    def _store_response(self, endpoint, cache_key, data, response_headers):
+        """Écrit une réponse fraîche dans les caches mémoire et disque"""
+        fetched_at = time.time()
+        ttl = self._get_ttl(endpoint, data, cache_key)
+        # Le disque garde la réponse telle que reçue, avant fusion avec les entités en mémoire
+        self.cache_backend.set(cache_key, data, fetched_at, ttl,
+                               etag=response_headers.get('ETag'),
+                               last_modified=response_headers.get('Last-Modified'))
+        return self._remember(cache_key, endpoint, data, fetched_at, ttl)
+
+    def _revalidate_cache(self, endpoint, cache_key):
+        """Réponse 304 : l'entrée en cache est toujours à jour, on prolonge sa validité"""
+        print(f"Cache API revalidé (304 Not Modified) pour {endpoint}.")
+        now = time.time()
+        data = self.memory_cache.get_stale(cache_key)
+        if data is not None:
+            # Réponse déjà normalisée en mémoire : même objet, seule sa validité est prolongée
+            ttl = self._get_ttl(endpoint, data, cache_key)
+            self.cache_backend.touch(cache_key, now)
+            self.memory_cache.put(cache_key, data, now, ttl)
+            self.match_index.add_payload(endpoint, data, now, ttl, cache_key)
+            return self._resolve_entities(cache_key, data)
+        entry = self.cache_backend.get(cache_key)
+        if entry is None:
+            return {"error": "Cache local indisponible après revalidation."}
+        ttl = self._get_ttl(endpoint, entry.data, cache_key)
+        self.cache_backend.touch(cache_key, now)
+        return self._remember(cache_key, endpoint, entry.data, now, ttl)
+
+    def _fallback_to_cache_or_error(self, cache_key, error_message):
         """Tente de retourner le cache si la requête API échoue, sinon retourne une erreur."""
-        if os.path.exists(cache_file):
+        data = self._read_stale_cache(cache_key)
+        if data is not None:
+            print(f"Utilisation des données en mémoire (potentiellement obsolètes) suite à l'erreur: {error_message}")
+            return data
+        if self.cache_backend.contains(cache_key):
             print(f"Utilisation des données en cache (potentiellement obsolètes) suite à l'erreur: {error_message}")
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (IOError, json.JSONDecodeError) as e:
-                 print(f"Erreur lecture/décodage cache API lors du fallback {cache_file}: {e}")
+            entry = self.cache_backend.get(cache_key)
+            if entry is None:
                  return {"error": f"{error_message} (et cache indisponible/invalide)"}
+            return entry.data
         else:
             return {"error": error_message}
 
-    def _get_cache_filename(self, endpoint, params=None):
-
+    def _get_cache_key(self, endpoint, params=None):
+        """Clé de cache d'une requête (nom du fichier JSON sans extension)"""
         clean_endpoint = endpoint.replace('/', '_').replace('?', '_').replace('&', '_')
 
         param_str = ""
@@ -211,7 +1511,11 @@ class FootballDataAPI:
             param_hash = hashlib.md5(param_str.encode()).hexdigest()[:8]
             full_name = f"{clean_endpoint[:max_len - 10]}_{param_hash}.json"
 
-        return os.path.join(self.cache_dir, full_name)
+        return full_name[:-len('.json')]
+
+    def _get_day_cache_key(self, day):
+        """Clé de cache de la partition d'un jour de /matches"""
+        return self._get_cache_key("/matches", {'date': day})
 
     def get_match_details(self, match_id):
         """Récupère les détails d'un match spécifique"""
@@ -227,53 +1531,152 @@ class FootballDataAPI:
         today = datetime.now()
         date_from = (today - timedelta(days=3)).strftime('%Y-%m-%d')
         date_to = (today + timedelta(days=3)).strftime('%Y-%m-%d')
-        endpoint = "/matches"
-        params = {'dateFrom': date_from, 'dateTo': date_to}
-        return self._make_request(endpoint, params)
+        return self.get_matches_between(date_from, date_to)
 
-    def get_european_scorers(self):
-        """Récupère les meilleurs buteurs des principales compétitions européennes avec calcul des points Golden Boot"""
-        # Dictionnaire des coefficients par championnat
-        competition_coefficients = {
-            # Top 5 (coefficient 2.0)
-            'PL': 2.0,    # Premier League
-            'PD': 2.0,    # La Liga
-            'BL1': 2.0,   # Bundesliga
-            'SA': 2.0,    # Serie A
-            'FL1': 2.0,   # Ligue 1
-            
-            # Championnats intermédiaires (coefficient 1.5)
-            'DED': 1.5,   # Eredivisie
-            'PPL': 1.5,   # Primeira Liga
-            'BJL': 1.5,   # Jupiler Pro League
-            'RPL': 1.5,   # Russian Premier League
-            
-            # Championnats plus faibles (coefficient 1.0)
-            'SSL': 1.0,   # Super League
-            'EL1': 1.0,   # Liga I
-            'CL': 1.0     # Champions League (coefficient 1.0 car c'est une compétition internationale)
-        }
-        
+    def sync_competition_matches(self, competition_id, days_back=3, days_ahead=6):
+        """Synchronisation incrémentale des matchs d'une compétition (voir _sync_matches)"""
+        return self._sync_matches(f"/competitions/{competition_id}/matches", days_back, days_ahead)
+
+    def sync_team_matches(self, team_id, days_back=3, days_ahead=6):
+        """Synchronisation incrémentale des matchs d'une équipe (voir _sync_matches)"""
+        return self._sync_matches(f"/teams/{team_id}/matches", days_back, days_ahead)
+
+    def _sync_matches(self, endpoint, days_back, days_ahead):
+        """Met à jour le document complet d'un endpoint de matchs à partir de la fenêtre récente.
+
+        Seuls les matchs entre aujourd'hui - days_back et aujourd'hui + days_ahead (10 jours au
+        plus) sont demandés ; ceux dont lastUpdated a changé remplacent leur version en cache.
+        Retourne {'added', 'updated', 'unchanged'} ou {"error": ...}.
+        """
+        base_key = self._get_cache_key(endpoint)
+        if not self.cache_backend.contains(base_key):
+            # Pas encore de document complet sur disque : téléchargement initial
+            data = self._fetch_coalesced(endpoint, None, base_key)
+            if isinstance(data, dict) and 'error' in data:
+                return data
+            return {'added': len(_extract_matches(data)), 'updated': 0, 'unchanged': 0}
+
+        today = datetime.now()
+        params = {'dateFrom': (today - timedelta(days=days_back)).strftime('%Y-%m-%d'),
+                  'dateTo': (today + timedelta(days=days_ahead)).strftime('%Y-%m-%d')}
+        # Coalescée : les vues d'une saison expirée déclenchent une seule synchronisation
+        return self._fetch_coalesced(endpoint, params, self._get_cache_key(endpoint, params),
+                                     store=lambda *response: self._merge_sync_window(base_key, *response))
+
+    def _merge_sync_window(self, base_key, endpoint, cache_key, data, response_headers):
+        """Fusionne la fenêtre reçue dans le document complet en cache (mémoire et disque).
+
+        La comparaison se fait avec la réponse brute du disque : les matchs en mémoire sont les
+        entités partagées, déjà mises à jour par les autres endpoints.
+        """
+        entry = self.cache_backend.get(base_key)
+        if entry is None:
+            return {"error": "Document complet absent du cache pendant la synchronisation."}
+        base = entry.data
+
+        merged, counts = _merge_match_changes(base, data.get('matches', []))
+        now = time.time()
+        ttl = self._get_ttl(endpoint, merged, base_key)
+        # Les validateurs restent ceux du document complet reçu de l'API
+        validators = self.cache_backend.get_validators(base_key)
+        self.cache_backend.set(base_key, merged, now, ttl,
+                               etag=validators.get('etag'), last_modified=validators.get('last_modified'))
+        self._remember(base_key, endpoint, merged, now, ttl)
+        print(f"Synchronisation de {endpoint}: {counts['added']} ajouté(s), {counts['updated']} modifié(s).")
+        return counts
+
+    def get_matches_between(self, date_from, date_to):
+        """Récupère les matchs entre deux dates incluses ('AAAA-MM-JJ').
+
+        Le cache est découpé par jour : seuls les jours absents ou obsolètes sont demandés à
+        l'API (une requête par plage contiguë), la fenêtre est ensuite reconstituée localement.
+        """
+        indexed = self.match_index.date_matches(date_from, date_to)
+        if indexed is not None:
+            return indexed
+
+        day_payloads, missing_ranges = self._read_day_partitions(date_from, date_to)
+        for range_from, range_to in missing_ranges:
+            params = {'dateFrom': range_from, 'dateTo': range_to}
+            data = self._fetch_coalesced("/matches", params, self._get_cache_key("/matches", params),
+                                         store=lambda *response: self._store_day_partitions(range_from, range_to, *response))
+            error = self._merge_fetched_days(day_payloads, range_from, range_to, data)
+            if error:
+                return error
+        return _assemble_days(date_from, date_to, day_payloads)
+
+    def _read_day_partitions(self, date_from, date_to):
+        """Jours en cache encore valides et plages contiguës de jours à demander à l'API"""
+        day_payloads = {}
+        missing_ranges = []
+        for day in _days_between(date_from, date_to):
+            data = self._read_fresh_cache(self._get_day_cache_key(day), "/matches")
+            if data is not None:
+                day_payloads[day] = data
+            elif missing_ranges and _next_day(missing_ranges[-1][1]) == day \
+                    and len(_days_between(missing_ranges[-1][0], day)) <= MAX_DATE_RANGE_DAYS:
+                missing_ranges[-1] = (missing_ranges[-1][0], day)
+            else:
+                missing_ranges.append((day, day))
+        return day_payloads, missing_ranges
+
+    def _merge_fetched_days(self, day_payloads, range_from, range_to, data):
+        """Ajoute les jours d'une plage reçue ; en cas d'erreur, se replie sur les jours expirés"""
+        failed = isinstance(data, dict) and 'error' in data
+        for day in _days_between(range_from, range_to):
+            cache_key = self._get_day_cache_key(day)
+            day_data = self._read_stale_cache(cache_key)
+            if day_data is None and failed:
+                entry = self.cache_backend.get(cache_key)
+                day_data = entry.data if entry is not None else None
+            if day_data is None:
+                return data if failed else {"error": f"Matchs du {day} indisponibles."}
+            day_payloads[day] = day_data
+        return None
+
+    def _store_day_partitions(self, date_from, date_to, endpoint, cache_key, data, response_headers):
+        """Découpe une réponse /matches par jour (plage demandée) et enregistre chaque jour dans le cache"""
+        filters = data.get('filters') or {}
+        fetched_at = time.time()
+        for day in _days_between(date_from, date_to):
+            day_data = _slice_matches(dict(data, matches=[
+                match for match in data.get('matches', []) if (match.get('utcDate') or '')[:10] == day
+            ]))
+            day_data['filters'] = dict(filters, dateFrom=day, dateTo=day)
+            day_key = self._get_day_cache_key(day)
+            ttl = self._get_ttl(endpoint, day_data, day_key)
+            self.cache_backend.set(day_key, day_data, fetched_at, ttl)
+            self._remember(day_key, endpoint, day_data, fetched_at, ttl)
+        return data
+
+    def get_european_scorers(self, on_partial=None, max_workers=4):
+        """Récupère les meilleurs buteurs des principales compétitions européennes avec calcul des points Golden Boot.
+
+        Les compétitions sont interrogées en parallèle (max_workers threads, quota respecté par
+        le limiteur) ; on_partial(classement) est appelé à chaque compétition reçue.
+        """
         all_scorers = []
-        
-        for comp_code, coefficient in competition_coefficients.items():
-            try:
-                scorers_data = self.get_competition_scorers(comp_code, limit=10)
-                if isinstance(scorers_data, dict) and 'scorers' in scorers_data:
-                    for scorer in scorers_data['scorers']:
-                        # Ajouter les informations nécessaires
-                        scorer['competition'] = comp_code
-                        scorer['coefficient'] = coefficient
-                        # Calculer les points Golden Boot
-                        goals = scorer.get('goals', 0)
-                        scorer['golden_boot_points'] = goals * coefficient
-                        all_scorers.append(scorer)
-            except Exception as e:
-                print(f"Erreur lors de la récupération des buteurs pour {comp_code}: {e}")
-                continue
-        
-        # Trier les buteurs par points Golden Boot
-        all_scorers.sort(key=lambda x: x.get('golden_boot_points', 0), reverse=True)
-        
-        # Retourner les 20 meilleurs buteurs
-        return {'scorers': all_scorers[:20]}
\ No newline at end of file
+        priority = self._current_priority() # Transmise aux threads du pool
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._call_with_priority, priority, self.get_competition_scorers, comp_code, 10): comp_code
+                for comp_code in GOLDEN_BOOT_COEFFICIENTS
+            }
+            for future in as_completed(futures):
+                comp_code = futures[future]
+                try:
+                    all_scorers.extend(_golden_boot_entries(comp_code, future.result()))
+                except Exception as e:
+                    print(f"Erreur lors de la récupération des buteurs pour {comp_code}: {e}")
+                    continue
+                if on_partial:
+                    on_partial(_rank_golden_boot(all_scorers))
+
+        return _rank_golden_boot(all_scorers)
+
+    def _call_with_priority(self, priority, function, *args, **kwargs):
+        """Exécute function dans un thread du pool avec la priorité de l'appelant"""
+        with self.request_priority(priority):
+            return function(*args, **kwargs)
+
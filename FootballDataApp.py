@@ -1,14 +1,40 @@
+from collections import deque
 from FootballDataAPi import *
+from FootballDataLive import LiveMatchPoller
+from FootballDataPrefetch import PrefetchScheduler
+
+LOGO_WORKERS = 4 # Téléchargements/décodages de logos simultanés
+LOGO_FRAME_MS = 16 # Intervalle entre deux lots de logos appliqués (une image à 60 Hz)
+LOGO_BATCH_BUDGET = 0.008 # Temps maximal passé par lot à créer et poser les logos, en secondes
 
 class FootballDataApp:
 
 
     def __init__(self, api_key):
-        self.api = FootballDataAPI(api_key)
+        # Données expirées affichées tout de suite puis rafraîchies en arrière-plan
+        self.api = FootballDataAPI(api_key, stale_while_revalidate=True, bulk_season=True,
+                                   scorers_fetch_limit=50, # Plus long classement affiché
+                                   cache_max_bytes=50 * 1024 * 1024,
+                                   image_cache_max_bytes=20 * 1024 * 1024)
+        # Préchargement des vues de la compétition sélectionnée, en priorité basse
+        self.prefetcher = PrefetchScheduler(self.api)
         self.competitions = []
         self.selected_competition = None
         self._logo_photo_cache = {}
         self._tree_logo_refs = {}
+        # Pool borné pour les logos des tableaux, un seul chargement en cours par (équipe, taille)
+        self._logo_executor = ThreadPoolExecutor(max_workers=LOGO_WORKERS, thread_name_prefix='logo')
+        self._logo_futures = {}
+        self._logo_futures_lock = threading.Lock()
+        # Résultats des workers de logos (images PIL, atlas) en attente d'être appliqués par le
+        # thread Tk, par lots ; les workers ne font qu'ajouter à cette file
+        self._pending_logos = deque() # (fonction, arguments)
+        self._pending_logos_lock = threading.Lock()
+        self._logo_jobs_outstanding = 0 # Chargements lancés dont le résultat n'est pas encore en file
+        self._logo_flush_scheduled = False # Lu et modifié par le thread Tk uniquement
+        self._view_token = 0 # Incrémenté à chaque changement de vue
+        self._live_poller = None # Suivi des matchs en direct de la vue courante
+        self._live_match_labels = {} # id du match -> (label statut, label score)
 
 
         self.root = tk.Tk()
@@ -21,6 +47,7 @@ class FootballDataApp:
 
         self.current_standings_tree = None # Référence au Treeview du classement actuel
         self.current_scorers_tree = None # Référence au Treeview des buteurs actuel
+        self.current_golden_boot_tree = None # Référence au Treeview Golden Boot actuel
 
         self.create_widgets()
         self.load_competitions()
@@ -128,9 +155,11 @@ class FootballDataApp:
         if selected_index >= 0 and self.competitions:
             self.selected_competition = self.competitions[selected_index]
             print(f"Compétition sélectionnée: {self.selected_competition.get('name', 'N/A')}")
+            self.prefetcher.prefetch_competition(self.selected_competition)
 
         else:
              self.selected_competition = None
+             self.prefetcher.cancel()
              # Désactiver les boutons si aucune compétition n'est valide/sélectionnée
              self.standings_button.config(state=tk.DISABLED)
              self.matches_button.config(state=tk.DISABLED)
@@ -146,30 +175,63 @@ class FootballDataApp:
 
         self.current_standings_tree = None
         self.current_scorers_tree = None
+        self.current_golden_boot_tree = None
         self._tree_logo_refs.clear() # Nettoyer les références de logo
+        self._view_token += 1 # Invalide les rafraîchissements destinés à l'ancienne vue
+        if self._live_poller:
+            self._live_poller.stop()
+            self._live_poller = None
+        self._live_match_labels.clear()
+
+    def _refresh_view(self, view_token, display_callback, data):
+        """Ré-affiche la vue courante avec des données rafraîchies en arrière-plan (appelé via root after)"""
+        if view_token != self._view_token:
+            return # L'utilisateur a changé de vue entre-temps
+        # Conserver le titre de la vue, remplacer le reste
+        for widget in self.content_frame.winfo_children()[1:]:
+            widget.destroy()
+        self._tree_logo_refs.clear()
+        display_callback(data, None)
+
+    def _make_refresh_callback(self, display_callback):
+        """Crée un callback on_refresh qui ré-affiche la vue courante dans le thread principal"""
+        view_token = self._view_token
+        return lambda data: self.root.after(0, self._refresh_view, view_token, display_callback, data)
 
     def load_team_logo(self, team_id, logo_url, size=(30, 30)):
-        """Charge le logo d'une équipe et renvoie un objet PhotoImage redimensionné"""
+        """Charge le logo d'une équipe et renvoie un objet PhotoImage redimensionné (thread Tk uniquement)"""
         cache_key = (team_id, size) # Clé de cache incluant la taille
         if cache_key in self._logo_photo_cache:
             return self._logo_photo_cache[cache_key]
+        return self._logo_photo(cache_key, self._load_logo_image(team_id, logo_url, size))
 
+    def _load_logo_image(self, team_id, logo_url, size):
+        """Miniature PIL d'un logo (sans objet Tk : peut tourner dans un thread de travail)"""
         try:
-
-            image_pil = self.api.get_team_logo(team_id, logo_url)
-            if image_pil:
-                # Redimensionner l'image
-                image_pil_resized = image_pil.resize(size, Image.Resampling.LANCZOS)
-                # Convertir en PhotoImage pour Tkinter
-                photo = ImageTk.PhotoImage(image_pil_resized)
-                # Mettre en cache l'objet PhotoImage
-                self._logo_photo_cache[cache_key] = photo
-                return photo
+            # Miniature déjà redimensionnée, en cache disque à côté du logo original
+            image = self.api.get_team_logo_thumbnail(team_id, logo_url, size)
+            if image is not None:
+                image.load() # Décodage complet hors du thread Tk
+            return image
         except Exception as e:
             print(f"Erreur de chargement/redimensionnement du logo pour l'équipe {team_id}: {e}")
-
         return None # Retourner None en cas d'échec
 
+    def _logo_photo(self, cache_key, image):
+        """PhotoImage d'une miniature PIL, mis en cache par (équipe, taille) (thread Tk uniquement)"""
+        if cache_key in self._logo_photo_cache:
+            return self._logo_photo_cache[cache_key]
+        if image is None:
+            return None
+        try:
+            # Convertir en PhotoImage pour Tkinter
+            photo = ImageTk.PhotoImage(image)
+        except Exception as e:
+            print(f"Erreur de conversion du logo pour l'équipe {cache_key[0]}: {e}")
+            return None
+        self._logo_photo_cache[cache_key] = photo
+        return photo
+
 
     def show_standings(self):
         """Affiche le classement de la compétition sélectionnée avec les logos et permet de voir les matchs d'une équipe"""
@@ -187,9 +249,11 @@ class FootballDataApp:
         loading_label.pack(pady=20)
         self.root.update() # Afficher le label de chargement
 
+        on_refresh = self._make_refresh_callback(self._display_standings)
+
         # Fonction pour charger les données en arrière-plan
         def _load_data():
-            standings_data = self.api.get_competition_standings(self.selected_competition['code'])
+            standings_data = self.api.get_competition_standings(self.selected_competition['code'], on_refresh=on_refresh)
             # Planifier la mise à jour de l'UI dans le thread principal
             self.root.after(0, self._display_standings, standings_data, loading_label)
 
@@ -198,7 +262,7 @@ class FootballDataApp:
 
     def _display_standings(self, standings_data, loading_label):
         """Met à jour l'UI avec les données du classement (appelé via root after)."""
-        if loading_label.winfo_exists():
+        if loading_label is not None and loading_label.winfo_exists():
             loading_label.destroy()
 
         # Vérification de l'erreur API
@@ -208,6 +272,7 @@ class FootballDataApp:
             return
 
         if 'standings' in standings_data and standings_data['standings']:
+            logo_rows = [] # (tree, item_id, team_id, logo_url) de tous les groupes, servis par un seul atlas
             for standing_type in standings_data['standings']:
                 group_name = standing_type.get('group', 'Classement général')
                 if group_name: # Ne pas afficher si le groupe est None ou vide
@@ -271,13 +336,8 @@ class FootballDataApp:
                             team_data.get('goalDifference', '')
                         ), tags=(str(team_id),)) # Utiliser l'ID comme tag
 
-                        # Lancer le chargement du logo en arrière-plan
                         if logo_url:
-                            threading.Thread(
-                                target=self._fetch_and_schedule_logo_update,
-                                args=(tree, item_id, team_id, logo_url),
-                                daemon=True
-                            ).start()
+                            logo_rows.append((tree, item_id, team_id, logo_url))
 
                     # Ajouter l'événement de double-clic APRÈS avoir ajouté les éléments
                     # Le lambda capture la variable 'tree' de cette itération de la boucle externe
@@ -285,21 +345,149 @@ class FootballDataApp:
                 else:
                      ttk.Label(table_frame, text="Données de classement non disponibles pour ce groupe.").pack()
 
+            # Lancer le chargement des logos en arrière-plan, via l'atlas de la compétition
+            competition_code = (standings_data.get('competition') or {}).get('code') \
+                or (self.selected_competition or {}).get('code')
+            self._schedule_crest_atlas(competition_code, logo_rows)
+
         else:
             ttk.Label(self.content_frame, text="Aucun classement disponible pour cette compétition.").pack()
 
 
-    def _fetch_and_schedule_logo_update(self, tree, item_id, team_id, logo_url):
-        """Charge le logo dans un thread et planifie la mise à jour de l'UI."""
-        try:
-            # Cette partie (réseau/disque/redimensionnement) est OK dans un thread
-            logo_photo = self.load_team_logo(team_id, logo_url, size=(30, 30))
+    def _schedule_logo_update(self, tree, item_id, team_id, logo_url, size=(30, 30)):
+        """Affiche le logo d'une équipe dans un item du Treeview dès qu'il est chargé"""
+        logo_photo = self._logo_photo_cache.get((team_id, size))
+        if logo_photo:
+            self._update_treeview_item_logo(tree, item_id, logo_photo)
+            return
 
-            if logo_photo:
+        self._deliver_to_tk(self._request_logo(team_id, logo_url, size),
+                            self._apply_logo, tree, item_id, (team_id, size))
+
+    def _apply_logo(self, tree, item_id, cache_key, image):
+        """Crée le PhotoImage d'un logo décodé et le pose dans sa ligne (thread Tk)"""
+        logo_photo = self._logo_photo(cache_key, image)
+        if logo_photo:
+            self._update_treeview_item_logo(tree, item_id, logo_photo)
+
+    def _deliver_to_tk(self, future, apply, *args):
+        """Appelle apply(*args, résultat) dans le thread Tk quand future est terminé (thread Tk uniquement).
+
+        Le worker se contente de mettre le résultat en file ; la file est vidée par
+        _flush_logo_updates, replanifié par le thread Tk tant que des chargements sont en cours.
+        """
+        with self._pending_logos_lock:
+            self._logo_jobs_outstanding += 1
+
+        def _on_done(future):
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Erreur lors du chargement d'un logo: {e}")
+                result = None
+            with self._pending_logos_lock:
+                self._logo_jobs_outstanding -= 1
+                self._pending_logos.append((apply, args + (result,)))
+
+        future.add_done_callback(_on_done)
+        if not self._logo_flush_scheduled:
+            self._logo_flush_scheduled = True
+            self.root.after(LOGO_FRAME_MS, self._flush_logo_updates)
+
+    def _flush_logo_updates(self):
+        """Applique les résultats en attente par lots bornés en temps (appelé via root after)."""
+        deadline = time.monotonic() + LOGO_BATCH_BUDGET
+        while time.monotonic() < deadline:
+            with self._pending_logos_lock:
+                if not self._pending_logos:
+                    break
+                apply, args = self._pending_logos.popleft()
+            apply(*args)
+        with self._pending_logos_lock:
+            keep_polling = bool(self._pending_logos) or self._logo_jobs_outstanding > 0
+        if keep_polling:
+            # Lot suivant à la prochaine image, pour laisser la boucle d'événements respirer
+            self.root.after(LOGO_FRAME_MS, self._flush_logo_updates)
+        else:
+            self._logo_flush_scheduled = False
+
+    def _schedule_crest_atlas(self, competition_code, logo_rows, size=(30, 30)):
+        """Affiche les logos d'un tableau à partir de l'atlas en cache de la compétition (un seul décodage d'image)"""
+        missing = [team_id for _, _, team_id, _ in logo_rows if (team_id, size) not in self._logo_photo_cache]
+        if not missing or not competition_code:
+            for tree, item_id, team_id, logo_url in logo_rows:
+                self._schedule_logo_update(tree, item_id, team_id, logo_url, size)
+            return
 
-                self.root.after(0, self._update_treeview_item_logo, tree, item_id, logo_photo)
+        # Lecture seule du cache disque : aucun téléchargement dans cette tâche
+        future = self._logo_executor.submit(self.api.get_crest_atlas, competition_code, missing, size)
+        self._deliver_to_tk(future, self._apply_crest_atlas, competition_code, logo_rows, size)
+
+    def _apply_crest_atlas(self, competition_code, logo_rows, size, atlas):
+        """Découpe l'atlas en PhotoImage par équipe et met à jour les lignes (thread Tk)."""
+        if atlas is None:
+            # Pas d'atlas valide : logos chargés en parallèle par le pool, atlas assemblé ensuite
+            self._load_rows_and_build_atlas(competition_code, logo_rows, size)
+            return
+
+        atlas_image, offsets = atlas
+        width, height = size
+        try:
+            # Un seul PhotoImage pour l'atlas ; chaque logo est une copie de sa région
+            atlas_photo = ImageTk.PhotoImage(atlas_image)
+            for team_id, (x, y) in offsets.items():
+                if (team_id, size) in self._logo_photo_cache:
+                    continue
+                photo = tk.PhotoImage(width=width, height=height)
+                photo.tk.call(photo, 'copy', atlas_photo, '-from', x, y, x + width, y + height)
+                self._logo_photo_cache[(team_id, size)] = photo
         except Exception as e:
-            print(f"Erreur chargement/planification logo pour {team_id} (item {item_id}): {e}")
+            print(f"Erreur lors du découpage de l'atlas des logos: {e}")
+
+        for tree, item_id, team_id, logo_url in logo_rows:
+            self._schedule_logo_update(tree, item_id, team_id, logo_url, size)
+
+    def _load_rows_and_build_atlas(self, competition_code, logo_rows, size):
+        """Charge les logos des lignes via le pool partagé, puis assemble l'atlas une fois tous terminés"""
+        for tree, item_id, team_id, logo_url in logo_rows:
+            self._schedule_logo_update(tree, item_id, team_id, logo_url, size)
+
+        # Miniatures de toutes les équipes du tableau (les logos déjà affichés sortent du cache disque)
+        futures = {}
+        for _, _, team_id, logo_url in logo_rows:
+            if team_id not in futures:
+                futures[team_id] = self._request_logo(team_id, logo_url, size)
+        remaining = [len(futures)]
+        remaining_lock = threading.Lock()
+
+        def _on_done(_):
+            with remaining_lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            thumbnails = [(team_id, future.result()) for team_id, future in futures.items()
+                          if not future.cancelled() and future.exception() is None]
+            self._logo_executor.submit(self.api.build_crest_atlas, competition_code, thumbnails, size)
+
+        for future in futures.values():
+            future.add_done_callback(_on_done)
+
+    def _request_logo(self, team_id, logo_url, size):
+        """Future de la miniature PIL d'un logo ; les demandes simultanées d'un même logo partagent la même"""
+        key = (team_id, size)
+        with self._logo_futures_lock:
+            future = self._logo_futures.get(key)
+            if future is not None:
+                return future
+            future = self._logo_executor.submit(self._load_logo_image, team_id, logo_url, size)
+            self._logo_futures[key] = future
+        # Une fois terminé, une nouvelle demande repassera par le cache disque des miniatures
+        future.add_done_callback(lambda _: self._forget_logo_future(key))
+        return future
+
+    def _forget_logo_future(self, key):
+        with self._logo_futures_lock:
+            self._logo_futures.pop(key, None)
 
     def _update_treeview_item_logo(self, tree, item_id, logo_photo):
         """Met à jour l'image d'un item dans le Treeview (appelé via root after)."""
@@ -399,9 +587,9 @@ class FootballDataApp:
              ttk.Label(team_window, text="Format de réponse inattendu.").pack(pady=20)
              return
 
-        all_matches = matches_data.get('matches', [])
         # Trier les matchs par date (le plus récent en premier pour 'Passés', le plus proche en premier pour 'À venir')
-        all_matches.sort(key=lambda m: m.get('utcDate', ''), reverse=True)
+        # sorted() : la liste reçue est partagée avec le cache mémoire de l'API
+        all_matches = sorted(matches_data.get('matches', []), key=lambda m: m.get('utcDate', ''), reverse=True)
 
         finished_matches = [m for m in all_matches if m.get('status') == 'FINISHED']
         scheduled_matches = [m for m in all_matches if m.get('status') in ['SCHEDULED', 'TIMED', 'IN_PLAY', 'PAUSED']] # Inclure en cours/pause
@@ -425,8 +613,12 @@ class FootballDataApp:
                  notebook.add(tab_frame, text=f"{tab_name} ({len(tab_frame.winfo_children())})") # Afficher le nombre de matchs dans le titre de l'onglet
 
 
-    def create_matches_tab(self, parent, matches, team_id):
-        """Crée un onglet avec une liste de matchs pour une équipe avec une meilleure structure d'affichage"""
+    def create_matches_tab(self, parent, matches, team_id, row_labels=None):
+        """Crée un onglet avec une liste de matchs pour une équipe avec une meilleure structure d'affichage.
+
+        Si row_labels est fourni, il reçoit {id du match: (label statut, label score)} pour les
+        mises à jour en direct.
+        """
         tab = ttk.Frame(parent)
 
         if not matches:
@@ -501,18 +693,9 @@ class FootballDataApp:
             comp_label.pack(side=tk.RIGHT, padx=10)
 
             # Statut du match avec couleur appropriée
-            status_colors = {
-                'FINISHED': '#28a745',    # Vert
-                'SCHEDULED': '#007bff',   # Bleu
-                'IN_PLAY': '#ffc107',     # Jaune
-                'PAUSED': '#ffc107',      # Jaune
-                'POSTPONED': '#dc3545',   # Rouge
-                'CANCELLED': '#dc3545'    # Rouge
-            }
             status = match['status']
-            status_color = status_colors.get(status, '#6c757d')  # Gris par défaut
             status_label = ttk.Label(header_frame, text=status,
-                                   foreground=status_color,
+                                   foreground=self._status_color(status),
                                    font=("Arial", 9, "bold"))
             status_label.pack(side=tk.RIGHT, padx=5)
 
@@ -572,17 +755,13 @@ class FootballDataApp:
                 home_logo_label.pack(side=tk.RIGHT)
 
             # Score au centre
-            if match['status'] == 'FINISHED':
-                score_text = f"{match['score']['fullTime']['home']} - {match['score']['fullTime']['away']}"
-                score_color = '#28a745'  # Vert pour les matchs terminés
-            else:
-                score_text = "vs"
-                score_color = '#6c757d'  # Gris pour les matchs à venir
-
+            score_text, score_color = self._score_display(match)
             score_label = ttk.Label(score_frame, text=score_text,
                                   font=("Arial", 12, "bold"),
                                   foreground=score_color)
             score_label.pack(expand=True)
+            if row_labels is not None:
+                row_labels[match['id']] = (status_label, score_label)
 
             # Logo équipe extérieure
             if away_logo:
@@ -607,6 +786,42 @@ class FootballDataApp:
 
         return tab
 
+    def _status_color(self, status):
+        """Couleur d'affichage du statut d'un match"""
+        status_colors = {
+            'FINISHED': '#28a745',    # Vert
+            'SCHEDULED': '#007bff',   # Bleu
+            'IN_PLAY': '#ffc107',     # Jaune
+            'PAUSED': '#ffc107',      # Jaune
+            'POSTPONED': '#dc3545',   # Rouge
+            'CANCELLED': '#dc3545'    # Rouge
+        }
+        return status_colors.get(status, '#6c757d')  # Gris par défaut
+
+    def _score_display(self, match):
+        """Texte et couleur du score : final, en cours, ou « vs » avant le match"""
+        full_time = match.get('score', {}).get('fullTime', {})
+        if match['status'] == 'FINISHED':
+            return f"{full_time.get('home')} - {full_time.get('away')}", '#28a745'  # Vert pour les matchs terminés
+        if match['status'] in ('IN_PLAY', 'PAUSED') and full_time.get('home') is not None:
+            return f"{full_time.get('home')} - {full_time.get('away')}", '#ffc107'  # Jaune pendant le match
+        return "vs", '#6c757d'  # Gris pour les matchs à venir
+
+    def _apply_live_events(self, view_token, events):
+        """Met à jour uniquement le statut et le score des matchs modifiés (appelé via root after)"""
+        if view_token != self._view_token:
+            return # L'utilisateur a changé de vue entre-temps
+        for event in events:
+            labels = self._live_match_labels.get(event['match_id'])
+            if not labels or not labels[0].winfo_exists():
+                continue
+            status_label, score_label = labels
+            match = event['match']
+            if event['type'] == 'status':
+                status_label.configure(text=match['status'], foreground=self._status_color(match['status']))
+            score_text, score_color = self._score_display(match)
+            score_label.configure(text=score_text, foreground=score_color)
+
     def show_matches(self):
         """Affiche les matchs de la compétition sélectionnée par journée"""
         if not self.selected_competition:
@@ -688,8 +903,7 @@ class FootballDataApp:
             ttk.Label(self.matches_display_frame, text="Format de réponse inattendu.").pack()
             return
 
-        matches = matches_data.get('matches', [])
-        matches.sort(key=lambda m: m.get('utcDate', '')) # Trier par date/heure
+        matches = sorted(matches_data.get('matches', []), key=lambda m: m.get('utcDate', '')) # Trier par date/heure
 
         if matches:
 
@@ -717,16 +931,18 @@ class FootballDataApp:
         loading_label.pack(pady=20)
         self.root.update()
 
+        on_refresh = self._make_refresh_callback(self._display_scorers)
+
         # Fonction pour charger les données en arrière-plan
         def _load_data():
-            scorers_data = self.api.get_competition_scorers(self.selected_competition['code'], limit=20) # Afficher top 20
+            scorers_data = self.api.get_competition_scorers(self.selected_competition['code'], limit=20, on_refresh=on_refresh) # Afficher top 20
             self.root.after(0, self._display_scorers, scorers_data, loading_label)
 
         threading.Thread(target=_load_data, daemon=True).start()
 
     def _display_scorers(self, scorers_data, loading_label):
         """Met à jour l'UI avec les buteurs (appelé via root after)."""
-        if loading_label.winfo_exists():
+        if loading_label is not None and loading_label.winfo_exists():
             loading_label.destroy()
 
         if isinstance(scorers_data, dict) and 'error' in scorers_data:
@@ -788,11 +1004,7 @@ class FootballDataApp:
 
                  # Lancer chargement logo
                  if team_logo_url:
-                      threading.Thread(
-                          target=self._fetch_and_schedule_logo_update,
-                           args=(tree, item_id, team_id, team_logo_url),
-                           daemon=True
-                       ).start()
+                      self._schedule_logo_update(tree, item_id, team_id, team_logo_url)
         else:
             ttk.Label(self.content_frame, text="Aucune donnée de buteurs disponible").pack()
 
@@ -1087,9 +1299,17 @@ class FootballDataApp:
 
         matches = matches_data.get('matches', [])
         if matches:
-            matches_tab_content = self.create_matches_tab(self.content_frame, matches, None)
+            matches_tab_content = self.create_matches_tab(self.content_frame, matches, None,
+                                                          row_labels=self._live_match_labels)
             if matches_tab_content:
                 matches_tab_content.pack(fill=tk.BOTH, expand=True)
+
+            # Suivre les matchs en cours ou à venir ; seules leurs lignes sont mises à jour
+            view_token = self._view_token
+            self._live_poller = LiveMatchPoller(
+                self.api, matches,
+                lambda events: self.root.after(0, self._apply_live_events, view_token, events)
+            ).start()
         else:
             ttk.Label(self.content_frame, text="Aucun match prévu aujourd'hui.").pack(pady=20)
 
@@ -1377,16 +1597,25 @@ class FootballDataApp:
         loading_label.pack(pady=20)
         self.root.update()
 
-        # Fonction pour charger les données en arrière-plan
+        view_token = self._view_token
+
+        def _show(scorers_data, final):
+            # Ignorer les résultats si l'utilisateur a changé de vue
+            if view_token == self._view_token:
+                self._display_golden_boot(scorers_data, loading_label, final)
+
+        # Fonction pour charger les données en arrière-plan ; le classement provisoire
+        # s'affiche à chaque compétition reçue
         def _load_data():
-            scorers_data = self.api.get_european_scorers()
-            self.root.after(0, self._display_golden_boot, scorers_data, loading_label)
+            scorers_data = self.api.get_european_scorers(
+                on_partial=lambda partial: self.root.after(0, _show, partial, False))
+            self.root.after(0, _show, scorers_data, True)
 
         # Lancer le chargement dans un thread
         threading.Thread(target=_load_data, daemon=True).start()
 
-    def _display_golden_boot(self, scorers_data, loading_label):
-        """Met à jour l'UI avec les meilleurs buteurs d'Europe"""
+    def _display_golden_boot(self, scorers_data, loading_label, final=True):
+        """Met à jour l'UI avec les meilleurs buteurs d'Europe (classement provisoire si final est faux)"""
         if loading_label.winfo_exists():
             loading_label.destroy()
 
@@ -1395,9 +1624,18 @@ class FootballDataApp:
             ttk.Label(self.content_frame, text=f"Erreur chargement données: {scorers_data['error']}").pack()
             return
 
+        # Le tableau existe déjà (résultats partiels précédents) : le remplir à nouveau
+        tree = self.current_golden_boot_tree
+        if tree is not None and tree.winfo_exists():
+            self._fill_golden_boot_tree(tree, scorers_data)
+            if final:
+                self._add_golden_boot_graph(self._golden_boot_notebook, scorers_data)
+            return
+
         # Créer un notebook pour différentes visualisations
         notebook = ttk.Notebook(self.content_frame)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self._golden_boot_notebook = notebook
 
         # 1. Tableau des buteurs
         table_frame = ttk.Frame(notebook)
@@ -1406,6 +1644,7 @@ class FootballDataApp:
         # Créer le tableau
         columns = ('rank', 'player', 'team_logo', 'team', 'competition', 'goals', 'coefficient', 'points', 'assists', 'matches')
         tree = ttk.Treeview(table_frame, columns=columns, show='headings', height=20)
+        self.current_golden_boot_tree = tree # Garder référence
 
         # Configurer les colonnes
         tree.heading('rank', text='#')
@@ -1436,6 +1675,14 @@ class FootballDataApp:
 
         tree.pack(side='left', fill='both', expand=True)
 
+        self._fill_golden_boot_tree(tree, scorers_data)
+        if final:
+            self._add_golden_boot_graph(notebook, scorers_data)
+
+    def _fill_golden_boot_tree(self, tree, scorers_data):
+        """(Re)remplit le tableau Golden Boot et lance le chargement des logos"""
+        tree.delete(*tree.get_children())
+
         # Dictionnaire des noms de compétitions
         competition_names = {
             'PL': 'Premier League',
@@ -1477,12 +1724,10 @@ class FootballDataApp:
 
             # Charger le logo de l'équipe
             if team_logo_url:
-                threading.Thread(
-                    target=self._fetch_and_schedule_logo_update,
-                    args=(tree, item_id, team_id, team_logo_url),
-                    daemon=True
-                ).start()
+                self._schedule_logo_update(tree, item_id, team_id, team_logo_url)
 
+    def _add_golden_boot_graph(self, notebook, scorers_data):
+        """Ajoute l'onglet graphique du classement Golden Boot définitif"""
         # 2. Graphique des buteurs
         graph_frame = ttk.Frame(notebook)
         notebook.add(graph_frame, text="Graphique")
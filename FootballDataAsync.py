@@ -0,0 +1,423 @@
+import asyncio
+import contextvars
+import functools
+import json
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+try:
+    import aiohttp
+except ImportError: # Dépendance optionnelle, seulement nécessaire pour le client asynchrone
+    aiohttp = None
+
+from FootballDataAPi import (FootballDataAPI, PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND,
+                             GOLDEN_BOOT_COEFFICIENTS, _filter_competitions, _slice_matches, _assemble_days,
+                             _slice_scorers,
+                             _golden_boot_entries, _rank_golden_boot, _parse_seconds, _placeholder_logo)
+
+RETRY_STATUSES = (500, 502, 503, 504) # Mêmes statuts réessayés que la session synchrone
+
+
+class AsyncFootballDataAPI:
+    """Client asyncio de l'API football-data.org, miroir de FootballDataAPI.
+
+    Toutes les requêtes partagent une seule boucle d'événements et une session aiohttp :
+    des centaines d'appels peuvent être lancés avec asyncio.gather sans un thread par requête.
+    Le cache (mémoire et disque), le limiteur de débit, la politique de TTL et les requêtes en
+    vol sont ceux de l'instance synchrone sync_api (créée à partir des mêmes options si elle n'est
+    pas fournie) : un appel synchrone et un appel asynchrone pour la même clé ne font qu'une requête.
+
+        async with AsyncFootballDataAPI(API_KEY) as api:
+            standings = await asyncio.gather(*(api.get_competition_standings(c) for c in codes))
+    """
+
+    def __init__(self, api_key=None, sync_api=None, pool_size=10, max_retries=3, timeout=10, **kwargs):
+        if aiohttp is None:
+            raise ImportError("Le client asynchrone nécessite aiohttp (pip install aiohttp).")
+        # Le cache et le quota sont partagés avec le client synchrone (ex. celui de l'interface)
+        self.sync_api = sync_api if sync_api is not None else FootballDataAPI(api_key, **kwargs)
+        self.base_url = self.sync_api.base_url
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.session = None # Créée à la première requête, dans la boucle d'événements courante
+
+        # Priorité courante, propre à chaque tâche asyncio
+        self._priority = contextvars.ContextVar('priority', default=PRIORITY_INTERACTIVE)
+
+        # Rafraîchissements en arrière-plan en cours (référence gardée jusqu'à leur fin)
+        self._background_tasks = set()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Ferme la session HTTP asynchrone"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _get_session(self):
+        if self.session is None:
+            # limit_per_host = connexions conservées par hôte (API + serveur des logos)
+            connector = aiohttp.TCPConnector(limit_per_host=self.pool_size)
+            self.session = aiohttp.ClientSession(connector=connector,
+                                                 timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self.session
+
+    @contextmanager
+    def request_priority(self, priority):
+        """Applique une priorité aux requêtes API émises par la tâche courante"""
+        token = self._priority.set(priority)
+        try:
+            yield
+        finally:
+            self._priority.reset(token)
+
+    async def get_competitions(self):
+        endpoint = "/competitions"
+        return _filter_competitions(await self._make_request(endpoint))
+
+    async def get_competition_standings(self, competition_id, on_refresh=None):
+        """Récupère le classement d'une compétition"""
+        endpoint = f"/competitions/{competition_id}/standings"
+        return await self._make_request(endpoint, on_refresh=on_refresh)
+
+    async def get_competition_matches(self, competition_id, matchday=None, status=None):
+        """Récupère les matchs d'une compétition, éventuellement filtrés par journée et/ou statut"""
+        indexed = self.sync_api.match_index.competition_matches(competition_id, matchday, status)
+        if indexed is not None:
+            return indexed
+        endpoint = f"/competitions/{competition_id}/matches"
+        if self.sync_api.bulk_season:
+            return await self._season_matches(competition_id, matchday or None, status=status)
+        params = {}
+        if matchday:
+            params['matchday'] = matchday
+        if status:
+            params['status'] = status
+        return await self._make_request(endpoint, params)
+
+    async def get_competition_team_matches(self, competition_id, team_id, status=None):
+        """Matchs d'une équipe dans une compétition, extraits de la saison complète en cache"""
+        indexed = self.sync_api.match_index.competition_matches(competition_id, status=status, team_id=team_id)
+        if indexed is not None:
+            return indexed
+        return await self._season_matches(competition_id, team_id=team_id, status=status)
+
+    async def _season_matches(self, competition_id, matchday=None, team_id=None, status=None):
+        """Équivalent asynchrone de FootballDataAPI._season_matches"""
+        api = self.sync_api
+        view, needs_sync = await self._run_blocking(api._read_season_view, competition_id,
+                                                    matchday, team_id, status)
+        if view is None:
+            endpoint = f"/competitions/{competition_id}/matches"
+            return _slice_matches(await self._make_request(endpoint), matchday, team_id, status)
+        if not needs_sync:
+            return view
+        if api.stale_while_revalidate:
+            task = asyncio.ensure_future(self._sync_season_in_background(competition_id))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+            return view
+        result = await self.sync_competition_matches(competition_id)
+        if isinstance(result, dict) and 'error' in result:
+            print(f"Synchronisation de {competition_id} impossible, vue en cache servie : {result['error']}")
+            return view
+        refreshed, _ = await self._run_blocking(api._read_season_view, competition_id, matchday, team_id, status)
+        return refreshed or view
+
+    async def _sync_season_in_background(self, competition_id):
+        try:
+            with self.request_priority(PRIORITY_BACKGROUND):
+                await self.sync_competition_matches(competition_id)
+        except Exception as e:
+            print(f"Erreur lors de la synchronisation en arrière-plan de {competition_id}: {e}")
+
+    async def get_competition_scorers(self, competition_id, limit=10, on_refresh=None):
+        """Récupère les meilleurs buteurs d'une compétition (classement plus long en cache réutilisé)"""
+        api = self.sync_api
+        endpoint = f"/competitions/{competition_id}/scorers"
+        cached = await self._run_blocking(api._read_scorers_superset, endpoint, competition_id, limit)
+        if cached is not None:
+            return cached
+
+        fetch_limit = max(limit, api.scorers_fetch_limit or 0)
+        api._note_scorer_limit(competition_id, fetch_limit)
+        params = {'limit': fetch_limit}
+        if fetch_limit == limit:
+            return await self._make_request(endpoint, params, on_refresh=on_refresh)
+        refresh = (lambda data: on_refresh(_slice_scorers(data, limit))) if on_refresh else None
+        return _slice_scorers(await self._make_request(endpoint, params, on_refresh=refresh), limit)
+
+    async def get_team_matches(self, team_id, status=None):
+        """Récupère les matchs d'une équipe spécifique"""
+        indexed = self.sync_api.match_index.team_matches(team_id, status)
+        if indexed is not None:
+            return indexed
+        endpoint = f"/teams/{team_id}/matches"
+        params = {}
+        if status:
+            params['status'] = status
+        return await self._make_request(endpoint, params)
+
+    async def get_match_details(self, match_id):
+        """Récupère les détails d'un match spécifique"""
+        endpoint = f"/matches/{match_id}"
+        params = {
+            'include': 'statistics,standings,head2head,odds,referees'
+        }
+        return await self._make_request(endpoint, params)
+
+    async def get_today_matches(self):
+        """Récupère les matchs autour de la date actuelle (3 jours avant et après)"""
+        today = datetime.now()
+        date_from = (today - timedelta(days=3)).strftime('%Y-%m-%d')
+        date_to = (today + timedelta(days=3)).strftime('%Y-%m-%d')
+        return await self.get_matches_between(date_from, date_to)
+
+    async def get_matches_between(self, date_from, date_to):
+        """Récupère les matchs entre deux dates incluses, jours manquants demandés simultanément"""
+        api = self.sync_api
+        indexed = api.match_index.date_matches(date_from, date_to)
+        if indexed is not None:
+            return indexed
+
+        day_payloads, missing_ranges = await self._run_blocking(api._read_day_partitions, date_from, date_to)
+        fetched = await asyncio.gather(*(
+            self._fetch_coalesced("/matches", params, api._get_cache_key("/matches", params),
+                                  store=functools.partial(api._store_day_partitions,
+                                                          params['dateFrom'], params['dateTo']))
+            for params in ({'dateFrom': range_from, 'dateTo': range_to} for range_from, range_to in missing_ranges)
+        ))
+        for (range_from, range_to), data in zip(missing_ranges, fetched):
+            error = await self._run_blocking(api._merge_fetched_days, day_payloads, range_from, range_to, data)
+            if error:
+                return error
+        return _assemble_days(date_from, date_to, day_payloads)
+
+    async def sync_competition_matches(self, competition_id, days_back=3, days_ahead=6):
+        """Synchronisation incrémentale des matchs d'une compétition"""
+        return await self._sync_matches(f"/competitions/{competition_id}/matches", days_back, days_ahead)
+
+    async def sync_team_matches(self, team_id, days_back=3, days_ahead=6):
+        """Synchronisation incrémentale des matchs d'une équipe"""
+        return await self._sync_matches(f"/teams/{team_id}/matches", days_back, days_ahead)
+
+    async def _sync_matches(self, endpoint, days_back, days_ahead):
+        """Équivalent asynchrone de FootballDataAPI._sync_matches"""
+        api = self.sync_api
+        base_key = api._get_cache_key(endpoint)
+        if not await self._run_blocking(api.cache_backend.contains, base_key):
+            data = await self._fetch_coalesced(endpoint, None, base_key)
+            if isinstance(data, dict) and 'error' in data:
+                return data
+            return {'added': len(data.get('matches', [])), 'updated': 0, 'unchanged': 0}
+
+        today = datetime.now()
+        params = {'dateFrom': (today - timedelta(days=days_back)).strftime('%Y-%m-%d'),
+                  'dateTo': (today + timedelta(days=days_ahead)).strftime('%Y-%m-%d')}
+        return await self._fetch_coalesced(endpoint, params, api._get_cache_key(endpoint, params),
+                                           store=lambda *response: api._merge_sync_window(base_key, *response))
+
+    async def get_european_scorers(self, on_partial=None):
+        """Meilleurs buteurs européens (points Golden Boot), compétitions interrogées simultanément"""
+        all_scorers = []
+
+        async def _load(comp_code):
+            try:
+                scorers_data = await self.get_competition_scorers(comp_code, limit=10)
+                all_scorers.extend(_golden_boot_entries(comp_code, scorers_data))
+            except Exception as e:
+                print(f"Erreur lors de la récupération des buteurs pour {comp_code}: {e}")
+                return
+            if on_partial:
+                on_partial(_rank_golden_boot(all_scorers))
+
+        await asyncio.gather(*(_load(comp_code) for comp_code in GOLDEN_BOOT_COEFFICIENTS))
+        return _rank_golden_boot(all_scorers)
+
+    async def get_team_logo(self, team_id, crest_url):
+        """Récupère le logo d'une équipe (image PIL) depuis le cache fichier ou le réseau"""
+        if not crest_url:
+            return None
+
+        api = self.sync_api
+        image = await self._run_blocking(api._read_cached_logo, team_id)
+        if image is not None:
+            return image
+        if api._logo_failure(team_id, crest_url) is not None:
+            return _placeholder_logo()
+
+        try:
+            print(f"Téléchargement du logo pour {team_id} depuis {crest_url}")
+            async with self._get_session().get(crest_url, headers=api._logo_headers(crest_url)) as response:
+                response.raise_for_status()
+                content = await response.read()
+            # Décodage et écriture disque hors de la boucle d'événements
+            return await self._run_blocking(api._store_logo, team_id, content)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Erreur réseau lors du téléchargement du logo {team_id}: {e}")
+            reason = f"réseau : {e}"
+        except Exception as e:
+            print(f"Erreur générale lors du traitement/téléchargement du logo {team_id}: {e}")
+            reason = f"décodage : {e}"
+        await self._run_blocking(api._record_logo_failure, team_id, crest_url, reason)
+        return _placeholder_logo()
+
+    async def get_team_logo_thumbnail(self, team_id, crest_url, size=(30, 30)):
+        """Logo redimensionné à size, depuis le cache des miniatures"""
+        if not crest_url:
+            return None
+        api = self.sync_api
+        thumbnail = await self._run_blocking(api._read_cached_thumbnail, team_id, size)
+        if thumbnail is not None:
+            return thumbnail
+        image = await self.get_team_logo(team_id, crest_url)
+        if image is None:
+            return None
+        return await self._run_blocking(api._store_thumbnail, team_id, size, image)
+
+    async def get_crest_atlas(self, competition_code, team_ids, size=(30, 30)):
+        """Atlas en cache des logos d'une compétition (voir FootballDataAPI.get_crest_atlas)"""
+        return await self._run_blocking(self.sync_api.get_crest_atlas, competition_code, team_ids, size)
+
+    async def build_crest_atlas(self, competition_code, thumbnails, size=(30, 30)):
+        """Assemble et enregistre l'atlas à partir de miniatures déjà chargées"""
+        return await self._run_blocking(self.sync_api.build_crest_atlas, competition_code, thumbnails, size)
+
+    async def _run_blocking(self, function, *args):
+        """Exécute un accès disque du cache dans le pool de threads par défaut de la boucle"""
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+    async def _make_request(self, endpoint, params=None, on_refresh=None):
+        """Équivalent asynchrone de FootballDataAPI._make_request (même cache, même TTL)"""
+        api = self.sync_api
+        cache_key = api._get_cache_key(endpoint, params)
+
+        # Le cache mémoire est lu directement, le disque dans un thread
+        data = api.memory_cache.get(cache_key)
+        if data is not None:
+            api.cache_backend.note_access(cache_key)
+            return api._resolve_entities(cache_key, data)
+        if cache_key not in api.memory_cache:
+            data = await self._run_blocking(api._read_fresh_cache, cache_key, endpoint)
+            if data is not None:
+                return data
+
+        if api.stale_while_revalidate:
+            stale_data = api._read_stale_cache(cache_key)
+            if stale_data is not None:
+                task = asyncio.ensure_future(
+                    self._refresh_in_background(endpoint, params, cache_key, stale_data, on_refresh))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+                return stale_data
+
+        return await self._fetch_coalesced(endpoint, params, cache_key)
+
+    async def _refresh_in_background(self, endpoint, params, cache_key, stale_data, on_refresh):
+        """Rafraîchit une entrée expirée et notifie l'appelant si les données ont changé"""
+        try:
+            with self.request_priority(PRIORITY_BACKGROUND):
+                data = await self._fetch_coalesced(endpoint, params, cache_key)
+            # Contenu identique : 304, repli sur le cache suite à une erreur ou réponse inchangée
+            if on_refresh and data != stale_data and not (isinstance(data, dict) and 'error' in data):
+                on_refresh(data)
+        except Exception as e:
+            print(f"Erreur lors du rafraîchissement en arrière-plan de {endpoint}: {e}")
+
+    async def _fetch_coalesced(self, endpoint, params, cache_key, store=None):
+        """Interroge l'API avec une seule requête en vol par clé de cache, partagée avec sync_api"""
+        api = self.sync_api
+        with api._inflight_lock:
+            future = api._inflight.get(cache_key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                api._inflight[cache_key] = future
+        if not is_leader:
+            print(f"Requête déjà en cours pour {endpoint}, attente du résultat.")
+            return await asyncio.shield(asyncio.wrap_future(future))
+
+        try:
+            # Le cache a pu être rempli entre-temps (ex. par le client synchrone)
+            data = await self._run_blocking(self.sync_api._read_fresh_cache, cache_key, endpoint)
+            if data is None:
+                data = await self._fetch(endpoint, params, cache_key, store)
+            future.set_result(data)
+            return data
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with api._inflight_lock:
+                del api._inflight[cache_key]
+
+    async def _acquire_token(self, priority):
+        """Attend un jeton du limiteur partagé sans bloquer la boucle d'événements"""
+        while True:
+            wait = self.sync_api.rate_limiter.try_acquire(priority)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    async def _get(self, url, headers, params):
+        """GET avec retries exponentiels sur les erreurs serveur ; retourne (statut, en-têtes, corps)"""
+        for attempt in range(self.max_retries + 1):
+            async with self._get_session().get(url, headers=headers, params=params) as response:
+                body = await response.read()
+                if response.status not in RETRY_STATUSES or attempt == self.max_retries:
+                    return response.status, response.headers, body
+            await asyncio.sleep(0.5 * (2 ** attempt))
+
+    async def _fetch(self, endpoint, params, cache_key, store=None):
+        """Interroge l'API, écrit la réponse dans le cache et gère les erreurs"""
+        api = self.sync_api
+        url = f"{self.base_url}{endpoint}"
+        print(f"Requête API: {url} avec params {params}")
+        priority = self._priority.get()
+
+        headers = await self._run_blocking(api._conditional_headers, cache_key)
+        # aiohttp n'accepte que des chaînes dans les paramètres de requête
+        query = {k: str(v) for k, v in params.items()} if params else None
+        try:
+            for attempt in range(2):
+                # Attendre un jeton du limiteur (la vue affichée passe avant le fond)
+                await self._acquire_token(priority)
+                status, response_headers, body = await self._get(url, headers, query)
+                api.rate_limiter.update_from_headers(response_headers)
+                if status != 429:
+                    break
+                wait_time = _parse_seconds(response_headers.get('Retry-After')) or 60
+                api.rate_limiter.penalize(wait_time)
+                # Avec un cache (même obsolète) la vue n'attend pas ; sinon on réessaie une fois
+                if attempt or (priority == PRIORITY_INTERACTIVE and api._has_cached(cache_key)):
+                    print(f"Limite API atteinte. Attente de {wait_time:.0f} secondes.")
+                    return await self._run_blocking(api._fallback_to_cache_or_error, cache_key,
+                                                    f"Limite API atteinte. Réessayez dans {wait_time:.0f}s.")
+                print(f"Limite API atteinte. Nouvel essai dans {wait_time:.0f} secondes.")
+            if status == 304:
+                return await self._run_blocking(api._revalidate_cache, endpoint, cache_key)
+            if status >= 400:
+                print(f"Erreur HTTP lors de la requête API: {status}")
+                return await self._run_blocking(api._fallback_to_cache_or_error, cache_key, f"Erreur HTTP {status}")
+            data = json.loads(body)
+            return await self._run_blocking(store or api._store_response, endpoint, cache_key, data, response_headers)
+        except asyncio.TimeoutError:
+            print(f"Erreur lors de la requête API: Timeout")
+            return await self._run_blocking(api._fallback_to_cache_or_error, cache_key,
+                                            "Timeout lors de la connexion à l'API.")
+        except aiohttp.ClientError as e:
+            print(f"Erreur lors de la requête API: {e}")
+            return await self._run_blocking(api._fallback_to_cache_or_error, cache_key, str(e))
+        except json.JSONDecodeError as e:
+            print(f"Erreur décodage JSON réponse API: {e}")
+            return await self._run_blocking(api._fallback_to_cache_or_error, cache_key, "Réponse invalide de l'API.")
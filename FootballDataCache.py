@@ -0,0 +1,556 @@
+import argparse
+import gzip
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from collections import namedtuple
+
+# Entrée du cache API : données décodées + métadonnées de fraîcheur et de revalidation
+CacheEntry = namedtuple('CacheEntry', ['data', 'fetched_at', 'ttl', 'etag', 'last_modified'])
+
+# Formats de fichier du stockage JSON, choisis par extension
+CACHE_FORMATS = ('json', 'json.gz')
+
+PRUNE_EVERY_WRITES = 20 # Fréquence de vérification des limites de taille du cache
+ACCESS_FLUSH_EVERY = 32 # Accès SQLite regroupés avant d'enregistrer last_access
+ACCESS_FLUSH_INTERVAL = 60 # ... ou au plus tard après ce délai, en secondes
+
+# Segments d'endpoint reconnus pour regrouper les clés par famille
+ENDPOINT_RESOURCES = ('competitions', 'teams', 'matches', 'standings', 'scorers', 'persons', 'areas')
+
+
+def encode_payload(data, file_format):
+    """Sérialise une réponse API dans le format donné ('json' lisible ou 'json.gz' compact)"""
+    if file_format == 'json.gz':
+        compact = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        return gzip.compress(compact.encode('utf-8'), compresslevel=6)
+    return json.dumps(data, ensure_ascii=False, indent=4).encode('utf-8') # Indent pour lisibilité
+
+
+def endpoint_family(key):
+    """Famille d'endpoint d'une clé de cache : '_competitions_PL_matches_matchday-1' -> 'competitions/*/matches'"""
+    if key.startswith('team_') and key.endswith('.png'):
+        # Miniatures redimensionnées : team_{id}_{largeur}x{hauteur}.png
+        return 'logos/thumbnails' if key.count('_') == 2 else 'logos'
+    if key.startswith('atlas_'):
+        return 'logos/atlases' # Atlas par compétition (image + index des positions)
+    family = []
+    for index, segment in enumerate(key.strip('_').split('_')):
+        if '-' in segment: # Début des paramètres de requête
+            break
+        if index % 2 == 0:
+            if segment not in ENDPOINT_RESOURCES:
+                break
+            family.append(segment)
+        else:
+            family.append('*') # Identifiant (code de compétition, id d'équipe...)
+    return '/'.join(family) or 'autres'
+
+
+def select_lru_evictions(usage, max_bytes=None, max_entries=None):
+    """Choisit les clés à supprimer, des moins récemment utilisées aux plus récentes.
+
+    usage : liste de (clé, taille en octets, date du dernier accès).
+    """
+    entries = sorted(usage, key=lambda item: item[2])
+    total_bytes = sum(size for _, size, _ in entries)
+    count = len(entries)
+    evicted = []
+    for key, size, _ in entries:
+        if (max_bytes is None or total_bytes <= max_bytes) and (max_entries is None or count <= max_entries):
+            break
+        evicted.append(key)
+        total_bytes -= size
+        count -= 1
+    return evicted
+
+
+def usage_by_family(usage):
+    """Regroupe l'utilisation du cache par famille d'endpoint : {famille: (entrées, octets)}"""
+    families = {}
+    for key, size, _ in usage:
+        entries, total = families.get(endpoint_family(key), (0, 0))
+        families[endpoint_family(key)] = (entries + 1, total + size)
+    return families
+
+
+def _remove_if_present(path):
+    """Supprime un fichier, sans erreur s'il a déjà été supprimé (élagage concurrent)"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def decode_payload(raw):
+    """Désérialise une réponse quel que soit son format (gzip, zlib ou JSON brut)"""
+    if isinstance(raw, str):
+        return json.loads(raw)
+    if raw[:2] == b'\x1f\x8b': # En-tête gzip
+        raw = gzip.decompress(raw)
+    elif raw[:1] == b'\x78': # En-tête zlib (stockage SQLite compressé)
+        raw = zlib.decompress(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+class BoundedCache:
+    """Base des stockages bornés en octets et/ou en entrées, avec éviction LRU.
+
+    Les sous-classes fournissent usage() (clé, taille, dernier accès) et delete(key).
+    Les accès servis depuis la mémoire sont notés sans toucher au disque.
+    """
+
+    def __init__(self, max_bytes=None, max_entries=None):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._access = {} # clé -> date du dernier accès connue en mémoire
+        self._access_lock = threading.Lock()
+        self._prune_lock = threading.Lock() # Un seul élagage à la fois (écritures concurrentes)
+        self._writes = 0
+
+    def note_access(self, key):
+        with self._access_lock:
+            self._access[key] = time.time()
+
+    def _last_access(self, key, stored_access):
+        with self._access_lock:
+            return max(self._access.get(key, 0), stored_access or 0)
+
+    def _maybe_prune(self):
+        """Vérifie les limites toutes les PRUNE_EVERY_WRITES écritures"""
+        if self.max_bytes is None and self.max_entries is None:
+            return
+        with self._access_lock:
+            self._writes += 1
+            due = self._writes % PRUNE_EVERY_WRITES == 0
+        if due:
+            try:
+                self.prune()
+            except OSError as e: # L'écriture a réussi, un élagage manqué sera refait plus tard
+                print(f"Erreur élagage cache : {e}")
+
+    def _delete_keys(self, keys):
+        for key in keys:
+            self.delete(key)
+
+    def prune(self, max_bytes=None, max_entries=None):
+        """Supprime les entrées les moins récemment utilisées au-delà des limites ; retourne leur nombre"""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        max_entries = self.max_entries if max_entries is None else max_entries
+        if max_bytes is None and max_entries is None:
+            return 0
+        with self._prune_lock:
+            evicted = select_lru_evictions(self.usage(), max_bytes, max_entries)
+            if evicted:
+                self._delete_keys(evicted)
+                with self._access_lock:
+                    for key in evicted:
+                        self._access.pop(key, None)
+                print(f"Cache élagué : {len(evicted)} entrées supprimées")
+            return len(evicted)
+
+    def stats(self):
+        """Utilisation par famille d'endpoint : {famille: (entrées, octets)}"""
+        return usage_by_family(self.usage())
+
+
+class JsonDirectoryCache(BoundedCache):
+    """Stockage par défaut : un fichier JSON par entrée dans cache_dir.
+
+    La date de modification du fichier sert de date de récupération et la date d'accès
+    de date de dernière utilisation ; le TTL et les validateurs HTTP (ETag /
+    Last-Modified) sont gardés dans un fichier .meta voisin.
+    file_format choisit l'extension écrite ('json' ou 'json.gz') ; les deux sont lus.
+    """
+
+    def __init__(self, cache_dir, file_format='json', max_bytes=None, max_entries=None):
+        if file_format not in CACHE_FORMATS:
+            raise ValueError(f"Format de cache inconnu : {file_format}")
+        super().__init__(max_bytes, max_entries)
+        self.cache_dir = cache_dir
+        self.file_format = file_format
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+    def _path(self, key, file_format=None):
+        return os.path.join(self.cache_dir, f"{key}.{file_format or self.file_format}")
+
+    def _existing_path(self, key):
+        """Fichier présent pour la clé, en privilégiant le format configuré"""
+        for file_format in (self.file_format,) + CACHE_FORMATS:
+            path = self._path(key, file_format)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _meta_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json.meta")
+
+    def _read_meta(self, key):
+        try:
+            with open(self._meta_path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            return {}
+
+    def _write_atomic(self, path, content):
+        """Écrit dans un fichier temporaire puis le renomme : jamais de fichier à moitié écrit"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def contains(self, key):
+        return self._existing_path(key) is not None
+
+    def get(self, key):
+        """Retourne l'entrée (CacheEntry) ou None si absente/illisible"""
+        path = self._existing_path(key)
+        if path is None:
+            return None
+        try:
+            fetched_at = os.path.getmtime(path)
+            with open(path, 'rb') as f:
+                data = decode_payload(f.read())
+            # Date d'accès explicite (fiable même sur un système monté en noatime)
+            os.utime(path, (time.time(), fetched_at))
+        except (IOError, EOFError, ValueError, zlib.error) as e: # EOFError : .json.gz tronqué
+            print(f"Erreur lecture/décodage cache API {path}: {e}")
+            return None
+        meta = self._read_meta(key)
+        return CacheEntry(data, fetched_at, meta.get('ttl'), meta.get('etag'), meta.get('last_modified'))
+
+    def get_validators(self, key):
+        meta = self._read_meta(key)
+        return {'etag': meta.get('etag'), 'last_modified': meta.get('last_modified')}
+
+    def set(self, key, data, fetched_at, ttl, etag=None, last_modified=None):
+        path = self._path(key)
+        try:
+            self._write_atomic(path, encode_payload(data, self.file_format))
+            meta = {'ttl': ttl, 'etag': etag, 'last_modified': last_modified}
+            self._write_atomic(self._meta_path(key), json.dumps(meta).encode('utf-8'))
+            os.utime(path, (fetched_at, fetched_at))
+            # Supprimer la copie dans l'autre format (ancien fichier .json par exemple)
+            for file_format in CACHE_FORMATS:
+                other_path = self._path(key, file_format)
+                if other_path != path:
+                    _remove_if_present(other_path)
+        except IOError as e:
+            print(f"Erreur écriture cache API {path}: {e}")
+        self._maybe_prune()
+
+    def touch(self, key, fetched_at):
+        """Prolonge la validité d'une entrée (réponse 304)"""
+        path = self._existing_path(key)
+        try:
+            if path:
+                os.utime(path, (fetched_at, fetched_at))
+        except OSError as e:
+            print(f"Erreur mise à jour cache API {path}: {e}")
+
+    def delete(self, key):
+        for path in [self._path(key, file_format) for file_format in CACHE_FORMATS] + [self._meta_path(key)]:
+            _remove_if_present(path)
+
+    def keys(self):
+        keys = set()
+        for name in os.listdir(self.cache_dir):
+            for file_format in CACHE_FORMATS:
+                if name.endswith('.' + file_format):
+                    keys.add(name[:-len(file_format) - 1])
+        return sorted(keys)
+
+    def usage(self):
+        """Liste (clé, taille des fichiers, dernier accès) en un seul parcours du dossier"""
+        entries = {}
+        for entry in os.scandir(self.cache_dir):
+            for suffix in CACHE_FORMATS + ('json.meta',):
+                if entry.name.endswith('.' + suffix):
+                    key = entry.name[:-len(suffix) - 1]
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError: # Supprimé entre-temps par un autre thread
+                        break
+                    size, access = entries.get(key, (0, 0))
+                    access = max(access, stat.st_atime) if suffix != 'json.meta' else access
+                    entries[key] = (size + stat.st_size, access)
+                    break
+        return [(key, size, self._last_access(key, access)) for key, (size, access) in entries.items()]
+
+
+class ImageDirectoryCache(BoundedCache):
+    """Dossier des logos (team_{id}.png) borné en taille, avec éviction LRU"""
+
+    def __init__(self, image_cache_dir, max_bytes=None, max_entries=None):
+        super().__init__(max_bytes, max_entries)
+        self.image_cache_dir = image_cache_dir
+        if not os.path.exists(image_cache_dir):
+            os.makedirs(image_cache_dir)
+
+    def path(self, name):
+        return os.path.join(self.image_cache_dir, name)
+
+    def note_saved(self, name):
+        """À appeler après l'écriture d'une image : déclenche l'élagage si nécessaire"""
+        self.note_access(name)
+        self._maybe_prune()
+
+    def delete(self, name):
+        _remove_if_present(self.path(name))
+
+    def usage(self):
+        # Les fichiers .json (échecs de logos, index des atlas) ne sont pas des images à évincer
+        usage = []
+        for entry in os.scandir(self.image_cache_dir):
+            if not entry.is_file() or entry.name.endswith('.json'):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError: # Supprimé entre-temps par un autre thread
+                continue
+            usage.append((entry.name, stat.st_size, self._last_access(entry.name, stat.st_atime)))
+        return usage
+
+
+class SQLiteCache(BoundedCache):
+    """Stockage du cache API dans un seul fichier SQLite, indexé et sûr entre threads.
+
+    Avec compress=True, les réponses sont stockées en JSON minifié compressé (zlib).
+    """
+
+    def __init__(self, db_path, compress=False, max_bytes=None, max_entries=None):
+        super().__init__(max_bytes, max_entries)
+        self.db_path = db_path
+        self.compress = compress
+        directory = os.path.dirname(db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        # Une seule connexion partagée, sérialisée par un verrou
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._unsaved_accesses = set() # Clés lues depuis le dernier enregistrement de last_access
+        self._last_access_flush = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    ttl REAL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    size INTEGER NOT NULL
+                )""")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_fetched_at ON cache(fetched_at)")
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(cache)")]
+            if 'last_access' not in columns: # Bases créées avant l'éviction LRU
+                self._conn.execute("ALTER TABLE cache ADD COLUMN last_access REAL")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_last_access ON cache(last_access)")
+
+    def note_access(self, key):
+        """Note l'accès en mémoire ; les dates sont enregistrées en base par lots"""
+        super().note_access(key)
+        with self._access_lock:
+            self._unsaved_accesses.add(key)
+            due = (len(self._unsaved_accesses) >= ACCESS_FLUSH_EVERY
+                   or time.time() - self._last_access_flush >= ACCESS_FLUSH_INTERVAL)
+        if due:
+            self.flush_accesses()
+
+    def flush_accesses(self):
+        """Enregistre last_access des entrées lues, pour garder l'ordre LRU après un redémarrage"""
+        with self._access_lock:
+            accesses = [(self._access[key], key) for key in self._unsaved_accesses if key in self._access]
+            self._unsaved_accesses.clear()
+            self._last_access_flush = time.time()
+        if not accesses:
+            return
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany("UPDATE cache SET last_access = ? WHERE key = ?", accesses)
+        except sqlite3.Error as e:
+            print(f"Erreur d'enregistrement des accès au cache SQLite: {e}")
+
+    def _execute(self, query, params=()):
+        with self._lock, self._conn: # Transaction atomique
+            return self._conn.execute(query, params).fetchall()
+
+    def contains(self, key):
+        return bool(self._execute("SELECT 1 FROM cache WHERE key = ?", (key,)))
+
+    def get(self, key):
+        """Retourne l'entrée (CacheEntry) ou None si absente/illisible"""
+        try:
+            rows = self._execute(
+                "SELECT payload, fetched_at, ttl, etag, last_modified FROM cache WHERE key = ?", (key,))
+            if not rows:
+                return None
+            self.note_access(key)
+            payload, fetched_at, ttl, etag, last_modified = rows[0]
+            return CacheEntry(decode_payload(payload), fetched_at, ttl, etag, last_modified)
+        except (sqlite3.Error, ValueError, zlib.error) as e:
+            print(f"Erreur lecture cache SQLite pour {key}: {e}")
+            return None
+
+    def get_validators(self, key):
+        rows = self._execute("SELECT etag, last_modified FROM cache WHERE key = ?", (key,))
+        etag, last_modified = rows[0] if rows else (None, None)
+        return {'etag': etag, 'last_modified': last_modified}
+
+    def set(self, key, data, fetched_at, ttl, etag=None, last_modified=None):
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        if self.compress:
+            payload = zlib.compress(payload.encode('utf-8'))
+            size = len(payload)
+        else:
+            size = len(payload.encode('utf-8'))
+        try:
+            self._execute(
+                "INSERT OR REPLACE INTO cache (key, payload, fetched_at, ttl, etag, last_modified, size, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, payload, fetched_at, ttl, etag, last_modified, size, fetched_at))
+        except sqlite3.Error as e:
+            print(f"Erreur écriture cache SQLite pour {key}: {e}")
+        self._maybe_prune()
+
+    def touch(self, key, fetched_at):
+        """Prolonge la validité d'une entrée (réponse 304)"""
+        self._execute("UPDATE cache SET fetched_at = ? WHERE key = ?", (fetched_at, key))
+
+    def delete(self, key):
+        self._execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def delete_expired(self, now):
+        """Supprime en une requête toutes les entrées expirées ; retourne leur nombre"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM cache WHERE ttl IS NOT NULL AND fetched_at + ttl < ?", (now,))
+            return cursor.rowcount
+
+    def keys(self):
+        return [row[0] for row in self._execute("SELECT key FROM cache")]
+
+    def usage(self):
+        rows = self._execute("SELECT key, size, COALESCE(last_access, fetched_at) FROM cache")
+        return [(key, size, self._last_access(key, access)) for key, size, access in rows]
+
+    def _delete_keys(self, keys):
+        # Enregistrer les accès connus en mémoire, puis supprimer en une seule transaction
+        self.flush_accesses()
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM cache WHERE key = ?", [(key,) for key in keys])
+
+    def import_from(self, source):
+        """Copie toutes les entrées d'un autre stockage (ex. JsonDirectoryCache) ; retourne leur nombre"""
+        count = 0
+        for key in source.keys():
+            entry = source.get(key)
+            if entry is None:
+                continue
+            self.set(key, entry.data, entry.fetched_at, entry.ttl, entry.etag, entry.last_modified)
+            count += 1
+        return count
+
+    def close(self):
+        self.flush_accesses()
+        with self._lock:
+            self._conn.close()
+
+
+def create_cache_backend(backend, cache_dir, cache_format='json', max_bytes=None, max_entries=None):
+    """Construit le stockage demandé : 'json' (défaut), 'sqlite' ou une instance déjà créée.
+
+    cache_format 'json.gz' active le format compact (fichiers gzip, ou zlib en SQLite).
+    max_bytes / max_entries bornent le stockage (éviction des entrées les moins utilisées).
+    À la création d'une base SQLite, les fichiers JSON existants de cache_dir sont importés.
+    """
+    if backend is None or backend == 'json':
+        return JsonDirectoryCache(cache_dir, cache_format, max_bytes, max_entries)
+    if backend == 'sqlite':
+        db_path = os.path.join(cache_dir, 'cache.sqlite3')
+        is_new = not os.path.exists(db_path)
+        store = SQLiteCache(db_path, compress=(cache_format == 'json.gz'),
+                            max_bytes=max_bytes, max_entries=max_entries)
+        if is_new and os.path.isdir(cache_dir):
+            count = store.import_from(JsonDirectoryCache(cache_dir))
+            if count:
+                print(f"Migration du cache : {count} entrées JSON importées dans {db_path}")
+        return store
+    return backend
+
+
+def benchmark_formats(cache_dir, repeat=20):
+    """Compare taille et temps de lecture des formats de cache sur les fichiers de cache_dir"""
+    codecs = [
+        ('json (indent=4)', lambda data: encode_payload(data, 'json')),
+        ('json minifié', lambda data: json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')),
+        ('json.gz', lambda data: encode_payload(data, 'json.gz')),
+        ('zlib (SQLite)', lambda data: zlib.compress(json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))),
+    ]
+    store = JsonDirectoryCache(cache_dir)
+    documents = [entry.data for entry in (store.get(key) for key in store.keys()) if entry]
+
+    print(f"{len(documents)} fichiers de {cache_dir}, lecture répétée {repeat} fois")
+    print(f"{'Format':<18}{'Taille totale':>15}{'Lecture (ms)':>15}")
+    for name, encode in codecs:
+        encoded = [encode(data) for data in documents]
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for raw in encoded:
+                decode_payload(raw)
+        elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+        print(f"{name:<18}{sum(len(raw) for raw in encoded) / 1024:>12.1f} Ko{elapsed_ms:>15.2f}")
+
+
+def print_stats(store, title):
+    """Affiche l'utilisation d'un stockage par famille d'endpoint"""
+    families = store.stats()
+    total_entries = sum(entries for entries, _ in families.values())
+    total_bytes = sum(size for _, size in families.values())
+    print(f"{title} : {total_entries} entrées, {total_bytes / 1024:.1f} Ko")
+    for family, (entries, size) in sorted(families.items(), key=lambda item: -item[1][1]):
+        print(f"  {family:<28}{entries:>6} entrées{size / 1024:>12.1f} Ko")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gestion du cache de l'application")
+    parser.add_argument('command', choices=['stats', 'prune', 'bench'])
+    parser.add_argument('--cache-dir', default='cache')
+    parser.add_argument('--image-cache-dir', default='image_cache')
+    parser.add_argument('--backend', choices=['json', 'sqlite'], default='json')
+    parser.add_argument('--max-bytes', type=int, help="Taille maximale du cache API (octets)")
+    parser.add_argument('--max-entries', type=int, help="Nombre maximal d'entrées du cache API")
+    parser.add_argument('--image-max-bytes', type=int, help="Taille maximale du cache des logos (octets)")
+    parser.add_argument('--image-max-entries', type=int, help="Nombre maximal de logos en cache")
+    args = parser.parse_args(argv)
+
+    if args.command == 'bench':
+        benchmark_formats(args.cache_dir)
+        return
+
+    if args.backend == 'sqlite' and not os.path.exists(os.path.join(args.cache_dir, 'cache.sqlite3')):
+        print(f"Aucune base SQLite dans {args.cache_dir}")
+        return
+    store = create_cache_backend(args.backend, args.cache_dir)
+    images = ImageDirectoryCache(args.image_cache_dir)
+
+    if args.command == 'prune':
+        store.prune(args.max_bytes, args.max_entries)
+        images.prune(args.image_max_bytes, args.image_max_entries)
+    print_stats(store, f"Cache API ({args.cache_dir})")
+    print_stats(images, f"Cache des logos ({args.image_cache_dir})")
+
+
+if __name__ == "__main__":
+    # Utilisation : python FootballDataCache.py stats | prune --max-bytes N | bench
+    main()
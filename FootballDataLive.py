@@ -0,0 +1,124 @@
+import threading
+from datetime import datetime, timezone
+
+from FootballDataAPi import PRIORITY_BACKGROUND, _parse_utc_date
+
+# Intervalle de rafraîchissement selon l'état des matchs suivis, en secondes
+LIVE_POLL_INTERVALS = {
+    'IN_PLAY': 30,
+    'LIVE': 30,
+    'PAUSED': 90,       # Mi-temps
+    'SUSPENDED': 300,
+}
+UPCOMING_STATUSES = ('SCHEDULED', 'TIMED')
+MIN_POLL_INTERVAL = 30    # Jamais plus d'une requête toutes les 30 s (quota gratuit : 10/min)
+MAX_POLL_INTERVAL = 900   # Réveil au moins tous les quarts d'heure en attendant un coup d'envoi
+
+
+def _snapshot(match):
+    """État comparé d'un poll à l'autre : statut et score courant"""
+    full_time = (match.get('score') or {}).get('fullTime') or {}
+    return match.get('status'), (full_time.get('home'), full_time.get('away'))
+
+
+class LiveMatchPoller:
+    """Suivi en arrière-plan des matchs en cours ou sur le point de commencer.
+
+    L'intervalle s'adapte à l'état des matchs (rapide pendant le jeu, plus lent à la mi-temps,
+    jusqu'au coup d'envoi sinon) et le suivi s'arrête quand tous les matchs sont terminés. Chaque
+    réponse est comparée à la précédente ; on_events(événements) reçoit (depuis le thread de
+    suivi) les changements de score et de statut :
+
+        {'type': 'score' | 'status', 'match_id': ..., 'old': ..., 'new': ..., 'match': {...}}
+    """
+
+    def __init__(self, api, matches, on_events):
+        self.api = api
+        self.on_events = on_events
+        # Seuls les matchs pouvant encore changer sont suivis
+        self._matches = {match['id']: match for match in matches
+                         if match.get('status') in LIVE_POLL_INTERVALS or match.get('status') in UPCOMING_STATUSES}
+        self._snapshots = {match_id: _snapshot(match) for match_id, match in self._matches.items()}
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self._matches and not self.running:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Arrête le suivi (au plus tard à la fin de la requête en cours)"""
+        self._stop.set()
+
+    def _run(self):
+        while self._matches and not self._stop.wait(self._next_interval()):
+            try:
+                events = self.poll()
+            except Exception as e:
+                print(f"Erreur lors du suivi des matchs en direct: {e}")
+                continue
+            if events and not self._stop.is_set():
+                self.on_events(events)
+
+    def _next_interval(self):
+        """Délai avant le prochain poll d'après l'état des matchs suivis"""
+        live_intervals = [LIVE_POLL_INTERVALS[status] for status, _ in self._snapshots.values()
+                          if status in LIVE_POLL_INTERVALS]
+        if live_intervals:
+            return min(live_intervals)
+        # Aucun match en cours : attendre le prochain coup d'envoi
+        now = datetime.now(timezone.utc)
+        kickoffs = [_parse_utc_date(match.get('utcDate')) for match in self._matches.values()]
+        waits = [(kickoff - now).total_seconds() for kickoff in kickoffs if kickoff is not None]
+        if not waits:
+            return MAX_POLL_INTERVAL
+        return max(MIN_POLL_INTERVAL, min(MAX_POLL_INTERVAL, min(waits)))
+
+    def _due_matches(self):
+        """Matchs à interroger : en cours, ou dont le coup d'envoi est passé"""
+        now = datetime.now(timezone.utc)
+        due = []
+        for match_id, match in self._matches.items():
+            kickoff = _parse_utc_date(match.get('utcDate'))
+            if self._snapshots[match_id][0] in LIVE_POLL_INTERVALS or kickoff is None or kickoff <= now:
+                due.append(match)
+        return due
+
+    def poll(self):
+        """Interroge l'API pour les matchs dus et retourne la liste des changements"""
+        due = self._due_matches()
+        if not due:
+            return []
+        days = sorted(match['utcDate'][:10] for match in due if match.get('utcDate'))
+        if not days:
+            return []
+        with self.api.request_priority(PRIORITY_BACKGROUND):
+            data = self.api.get_matches_between(days[0], days[-1])
+        if not isinstance(data, dict) or 'error' in data:
+            print(f"Suivi en direct : réponse invalide ({data.get('error') if isinstance(data, dict) else data})")
+            return []
+
+        events = []
+        for match in data.get('matches', []):
+            match_id = match.get('id')
+            if match_id not in self._snapshots:
+                continue
+            old_status, old_score = self._snapshots[match_id]
+            new_status, new_score = _snapshot(match)
+            if new_score != old_score:
+                events.append({'type': 'score', 'match_id': match_id, 'old': old_score, 'new': new_score, 'match': match})
+            if new_status != old_status:
+                events.append({'type': 'status', 'match_id': match_id, 'old': old_status, 'new': new_status, 'match': match})
+            self._matches[match_id] = match
+            self._snapshots[match_id] = (new_status, new_score)
+            if new_status not in LIVE_POLL_INTERVALS and new_status not in UPCOMING_STATUSES:
+                # Terminé, reporté, annulé : plus rien à suivre pour ce match
+                del self._matches[match_id]
+                del self._snapshots[match_id]
+        return events
@@ -0,0 +1,95 @@
+import threading
+from collections import deque
+
+from FootballDataAPi import PRIORITY_BACKGROUND
+
+PREFETCH_RESERVE_TOKENS = 3 # Requêtes du quota toujours laissées libres pour l'utilisateur
+
+
+class PrefetchScheduler:
+    """Préchargement en tâche de fond des vues d'une compétition sélectionnée.
+
+    Classement, buteurs, journée courante et voisines puis logos des équipes du classement sont
+    chargés dans le cache, un par un, en priorité basse. Une requête de préchargement n'est émise
+    que s'il reste plus de reserve_tokens jetons au limiteur ; changer de sélection (ou cancel())
+    abandonne tout le travail en attente.
+    """
+
+    def __init__(self, api, reserve_tokens=PREFETCH_RESERVE_TOKENS):
+        self.api = api
+        self.reserve_tokens = reserve_tokens
+        self._generation = 0 # Incrémenté à chaque sélection : les tâches plus anciennes sont ignorées
+        self._tasks = deque() # (génération, compte dans le quota API, tâche)
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def prefetch_competition(self, competition):
+        """Remplace le travail en attente par le préchargement de cette compétition"""
+        code = competition['code']
+        current_season = competition.get('currentSeason') or {}
+        matchday = current_season.get('currentMatchday') or 1
+        scorers_limit = max(20, self.api.scorers_fetch_limit or 0) # Taille affichée par show_scorers
+
+        with self._cond:
+            generation = self._cancel_locked()
+            self._tasks.extend([
+                (generation, True, lambda: self._prefetch_standings(generation, code)),
+                (generation, True, lambda: self.api.get_competition_scorers(code, limit=scorers_limit)),
+            ] + [
+                (generation, True, lambda day=day: self.api.get_competition_matches(code, day))
+                for day in (matchday, matchday - 1, matchday + 1) if day >= 1
+            ])
+            self._cond.notify_all()
+        print(f"Préchargement de {competition.get('name', code)} planifié.")
+
+    def cancel(self):
+        """Abandonne le préchargement en attente"""
+        with self._cond:
+            self._cancel_locked()
+            self._cond.notify_all()
+
+    def _cancel_locked(self):
+        self._generation += 1
+        self._tasks.clear()
+        return self._generation
+
+    def _prefetch_standings(self, generation, code):
+        """Classement, puis logos des équipes du classement (hors quota API)"""
+        standings_data = self.api.get_competition_standings(code)
+        if not isinstance(standings_data, dict) or not standings_data.get('standings'):
+            return
+        teams = [row.get('team', {}) for row in standings_data['standings'][0].get('table', [])]
+        with self._cond:
+            if generation != self._generation:
+                return
+            self._tasks.extend(
+                (generation, False, lambda team=team: self.api.get_team_logo(team['id'], team.get('crest')))
+                for team in teams if team.get('id') and team.get('crest')
+            )
+            self._cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._tasks:
+                    self._cond.wait()
+                generation, uses_quota, task = self._tasks.popleft()
+            if uses_quota and not self._wait_for_budget(generation):
+                continue
+            if generation != self._generation:
+                continue
+            try:
+                with self.api.request_priority(PRIORITY_BACKGROUND):
+                    task()
+            except Exception as e:
+                print(f"Erreur lors du préchargement: {e}")
+
+    def _wait_for_budget(self, generation):
+        """Attend qu'une requête puisse partir sans entamer la réserve ; False si annulé entre-temps"""
+        while self.api.rate_limiter.available() - 1 < self.reserve_tokens:
+            with self._cond:
+                if generation != self._generation:
+                    return False
+                self._cond.wait(timeout=1)
+        return generation == self._generation